@@ -1,7 +0,0 @@
-"""
-YouTube Video Downloader
-
-A simple and efficient YouTube video downloader using Python and yt-dlp.
-"""
-
-__version__ = "1.0.0"
\ No newline at end of file
@@ -6,14 +6,118 @@ This script demonstrates the new capabilities of the Universal Video Downloader
 for handling videos that come in segments (like HLS streams, DASH formats).
 """
 
+import argparse
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.universal_video_downloader import download_video, detect_platform, test_video_url
+from src.universal_video_downloader import (
+    _SEGMENTED_PROTOCOLS, download_video, detect_platform, test_video_url
+)
 
-def example_segmented_download():
-    """Example of downloading a segmented video."""
+# Default number of segments fetched in parallel
+DEFAULT_CONCURRENCY = 4
+
+# Maximum number of URLs tested at the same time
+MAX_PARALLEL_PROBES = 6
+
+def ask_concurrency() -> int:
+    """Ask how many segments should be downloaded in parallel."""
+    choice = input(f"⚡ Parallel chunks [{DEFAULT_CONCURRENCY}]: ").strip()
+    if not choice:
+        return DEFAULT_CONCURRENCY
+    try:
+        return int(choice)
+    except ValueError:
+        print(f"❌ Invalid number, using {DEFAULT_CONCURRENCY}.")
+        return DEFAULT_CONCURRENCY
+
+def start_probes(executor: ThreadPoolExecutor, urls: list) -> list:
+    """
+    Starts testing URLs in the background without waiting for the results.
+
+    Args:
+        executor (ThreadPoolExecutor): Executor running the probes
+        urls (list): Video URLs to test
+
+    Returns:
+        list: Futures resolving to (success, info), in the same order as urls
+    """
+    return [executor.submit(test_video_url, url) for url in urls]
+
+def handle_probed_url(url: str, success: bool, info: dict, concurrency: int = None):
+    """Show the probe result for one URL and offer to download it."""
+    # Detect platform
+    platform = detect_platform(url)
+    print(f"\n🔗 URL: {url}")
+    print(f"🎯 Platform detected: {platform}")
+    
+    if not success:
+        print(f"❌ URL not accessible: {info.get('error', 'Unknown error')}")
+        return
+        
+    print("✅ URL is accessible!")
+    
+    # Show video info
+    if 'title' in info:
+        print(f"📺 Title: {info['title']}")
+    if 'duration' in info:
+        print(f"⏱️  Duration: {info['duration']} seconds")
+        
+    # Check for segmented formats
+    formats = info.get('formats', [])
+    # Same check as main(): HLS/DASH formats often carry no fragment list
+    # until download time, so the protocol marks them too
+    segmented_formats = [f for f in formats if f.get('fragments')
+                         or str(f.get('protocol', '')).startswith(_SEGMENTED_PROTOCOLS)]
+    
+    if segmented_formats:
+        print(f"🔗 Found {len(segmented_formats)} segmented formats!")
+        print("📋 Segmented format details:")
+        for fmt in segmented_formats[:3]:  # Show first 3
+            fragments = fmt.get('fragments')
+            segments = f"{len(fragments)} segments" if fragments else fmt.get('protocol')
+            quality = fmt.get('height', 'unknown')
+            ext = fmt.get('ext', 'unknown')
+            print(f"   - {quality}p {ext}: {segments}")
+    else:
+        print("ℹ️  This video uses regular (non-segmented) format.")
+        
+    # Ask if user wants to download
+    download_choice = input("\n💾 Download this video? (y/N): ").strip().lower()
+    if download_choice in ['y', 'yes']:
+        parallel_chunks = concurrency if concurrency is not None else ask_concurrency()
+        
+        print("\n🚀 Starting download...")
+        print(f"Note: Segmented videos are fetched {parallel_chunks} chunks at a time.")
+        
+        # Create downloads directory
+        downloads_dir = "./downloads"
+        os.makedirs(downloads_dir, exist_ok=True)
+        
+        # Start download with segment-optimized settings
+        success = download_video(
+            url=url,
+            output_path=downloads_dir,
+            format_selector='best[height<=720]',  # Good balance for testing
+            concurrent_fragments=parallel_chunks,
+            info=info  # Already extracted by the probe, no need to fetch it again
+        )
+        
+        if success:
+            print("✅ Download completed successfully!")
+            print(f"📁 File saved to: {downloads_dir}")
+        else:
+            print("❌ Download failed. Check the error messages above.")
+
+def example_segmented_download(concurrency: int = None):
+    """
+    Example of downloading a segmented video.
+
+    Args:
+        concurrency (int): Segments fetched in parallel; prompts for it when None
+    """
     
     print("🔗 Segmented Video Download Example")
     print("=" * 50)
@@ -25,86 +129,43 @@ def example_segmented_download():
         "DASH Stream (example)": "https://example.com/manifest.mpd",  # Replace with actual DASH URL
     }
     
+    platforms = {desc: detect_platform(url) for desc, url in example_urls.items()}
+    
     print("\n📋 Example URLs for different types:")
-    for desc, url in example_urls.items():
-        platform = detect_platform(url)
+    for desc, platform in platforms.items():
         print(f"   {desc}: {platform}")
     
     print("\n🔍 Interactive Testing:")
-    print("Enter a video URL to test segmented download capabilities.")
+    print("Enter one or more video URLs to test segmented download capabilities.")
     print("Good examples include:")
     print("- YouTube videos (automatically handled)")
     print("- HLS streams (.m3u8 files)")
     print("- DASH streams (.mpd files)")
     print("- Any URL that serves video in chunks")
     
-    while True:
-        url = input("\n🔗 Enter video URL (or 'quit' to exit): ").strip()
-        
-        if url.lower() in ['quit', 'exit', 'q']:
-            print("👋 Goodbye!")
-            break
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_PROBES) as executor:
+        while True:
+            line = input("\n🔗 Enter video URL(s) separated by spaces (or 'quit' to exit): ").strip()
             
-        if not url:
-            continue
+            if line.lower() in ['quit', 'exit', 'q']:
+                print("👋 Goodbye!")
+                break
+                
+            if not line:
+                continue
             
-        # Detect platform
-        platform = detect_platform(url)
-        print(f"\n🎯 Platform detected: {platform}")
-        
-        # Test URL
-        print("🔍 Testing URL accessibility...")
-        success, info = test_video_url(url)
-        
-        if not success:
-            print(f"❌ URL not accessible: {info.get('error', 'Unknown error')}")
-            continue
+            urls = line.split()
             
-        print("✅ URL is accessible!")
-        
-        # Show video info
-        if 'title' in info:
-            print(f"📺 Title: {info['title']}")
-        if 'duration' in info:
-            print(f"⏱️  Duration: {info['duration']} seconds")
-            
-        # Check for segmented formats
-        formats = info.get('formats', [])
-        segmented_formats = [f for f in formats if f.get('fragments')]
-        
-        if segmented_formats:
-            print(f"🔗 Found {len(segmented_formats)} segmented formats!")
-            print("📋 Segmented format details:")
-            for fmt in segmented_formats[:3]:  # Show first 3
-                fragment_count = len(fmt.get('fragments', []))
-                quality = fmt.get('height', 'unknown')
-                ext = fmt.get('ext', 'unknown')
-                print(f"   - {quality}p {ext}: {fragment_count} segments")
-        else:
-            print("ℹ️  This video uses regular (non-segmented) format.")
+            # Probe in the background: the network round-trips overlap with the
+            # prompts below instead of leaving the user waiting on a spinner
+            print(f"🔍 Probing {len(urls)} URL(s) in background...")
+            probes = start_probes(executor, urls)
             
-        # Ask if user wants to download
-        download_choice = input("\n💾 Download this video? (y/N): ").strip().lower()
-        if download_choice in ['y', 'yes']:
-            print("\n🚀 Starting download...")
-            print("Note: For segmented videos, you'll see progress for each segment.")
+            batch_concurrency = concurrency if concurrency is not None else ask_concurrency()
             
-            # Create downloads directory
-            downloads_dir = "./downloads"
-            os.makedirs(downloads_dir, exist_ok=True)
-            
-            # Start download with segment-optimized settings
-            success = download_video(
-                url=url,
-                output_path=downloads_dir,
-                format_selector='best[height<=720]'  # Good balance for testing
-            )
-            
-            if success:
-                print("✅ Download completed successfully!")
-                print(f"📁 File saved to: {downloads_dir}")
-            else:
-                print("❌ Download failed. Check the error messages above.")
+            for url, probe in zip(urls, probes):
+                success, info = probe.result()
+                handle_probed_url(url, success, info, batch_concurrency)
 
 def explain_segmented_videos():
     """Explain what segmented videos are and how they work."""
@@ -130,7 +191,7 @@ def explain_segmented_videos():
 
 🛠️ How this downloader handles them:
    • Automatically detects segments
-   • Downloads each chunk sequentially
+   • Downloads several chunks in parallel
    • Shows progress per segment
    • Retries failed segments
    • Merges into final video file
@@ -143,5 +204,10 @@ def explain_segmented_videos():
 """)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Segmented video download example")
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help=f"segments downloaded in parallel (default: ask, {DEFAULT_CONCURRENCY})")
+    args = parser.parse_args()
+    
     explain_segmented_videos()
-    example_segmented_download()
\ No newline at end of file
+    example_segmented_download(args.concurrency)
\ No newline at end of file
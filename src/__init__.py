@@ -3,12 +3,27 @@ Universal Video Downloader Package
 
 A simple and efficient universal video downloader using Python and yt-dlp.
 Supports YouTube, Vimeo, HLS/DASH streams, and segmented videos.
+
+The downloader module (and yt-dlp with it) is imported on first attribute
+access, so ``import src`` stays cheap.
 """
 
 __version__ = "3.0.0"
 __author__ = "Universal Video Downloader Team"
 __email__ = "contact@example.com"
 
-from .universal_video_downloader import download_video, validate_youtube_url
+__all__ = [
+    "download_video",
+    "download_videos",
+    "validate_youtube_url",
+    "detect_platform",
+    "test_video_url",
+    "test_videos_batch",
+]
+
 
-__all__ = ["download_video", "validate_youtube_url"]
\ No newline at end of file
+def __getattr__(name):
+    if name in __all__:
+        from . import universal_video_downloader
+        return getattr(universal_video_downloader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,6 +22,7 @@ Features:
 Dependencies:
     - yt-dlp: Library for video downloading
     - Python 3.8+
+    - google-re2 (optional): linear-time matching for the YouTube/Vimeo URL patterns
 
 Usage:
     python universal_video_downloader.py
@@ -36,16 +37,377 @@ Author: Developed for educational purposes
 Date: 2025
 """
 
-import yt_dlp
+import argparse
+import atexit
+import copy
+import hashlib
+import importlib.metadata
+import importlib.util
 import os
+import random
 import re
 import json
+import logging
 import shutil
+import stat
+import string
 import subprocess
 import sys
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from urllib.parse import urlparse
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+from typing import Optional
+
+# RE2 (pip install google-re2) matches in linear time whatever the input; the
+# URL patterns only use syntax both engines accept, so re is a drop-in fallback
+try:
+    import re2 as _url_re
+except ImportError:
+    _url_re = re
+
+# Console logger for status messages. It writes to stderr, so piping stdout
+# (prompts, menus, progress) keeps every status line. Level comes from
+# $VIDEO_DL_LOG (e.g. DEBUG, WARNING to quiet it); defaults to INFO
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _log_handler = logging.StreamHandler(sys.stderr)
+    _log_handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(_log_handler)
+    logger.propagate = False
+_log_level = os.environ.get('VIDEO_DL_LOG', '').upper()
+if not isinstance(logging.getLevelName(_log_level), int):
+    _log_level = 'INFO'
+logger.setLevel(_log_level)
+
+# Upper bound for parallel fragment downloads; higher values tend to trigger CDN throttling
+_MAX_CONCURRENT_FRAGMENTS = 16
+
+# Parallel fragment downloads used by default for HLS/DASH videos. Fragment
+# fetches wait on the network, not the CPU, so small machines still get 4
+_DEFAULT_CONCURRENT_FRAGMENTS = max(4, min(8, os.cpu_count() or 4))
+
+# yt-dlp protocols of segmented formats. HLS formats never list 'fragments'
+# before download, so the protocol is what marks them as segmented
+_SEGMENTED_PROTOCOLS = ('m3u8', 'http_dash_segments')
+
+# Output filename template for full downloads; titles are capped at 200 chars to stay under filesystem limits
+_OUTTMPL_FMT = '%(title).200s.%(ext)s'
+
+# Single-pass host hint used by detect_platform() to skip validators that cannot match
+_PLATFORM_HINT_RE = re.compile(r'(?P<youtube>youtube\.com|youtu\.be)|(?P<vimeo>vimeo\.com)')
+
+# URL patterns, compiled once at import instead of on every validation
+# Leading "scheme://" of an absolute URL
+_SCHEME_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9+.-]*://')
+
+# Hosts accepted by the YouTube/Vimeo validators
+_YOUTUBE_DOMAINS = frozenset({'youtube.com', 'www.youtube.com', 'youtu.be', 'm.youtube.com'})
+_VIMEO_DOMAINS = frozenset({'vimeo.com', 'www.vimeo.com', 'player.vimeo.com'})
+
+# Every supported YouTube/Vimeo URL shape fused into one alternation, so a
+# validation is a single scan instead of one search per shape. The YouTube
+# pattern is anchored at both ends: it fails on the first mismatching
+# character, and an ID followed by more ID characters is rejected (a single
+# trailing slash, as in youtu.be/<id>/, is allowed)
+_YOUTUBE_URL_RE = _url_re.compile(
+    r'(?i:https?://)?(?:www\.|m\.)?'
+    r'(?:youtube\.com/(?:watch\?(?:\S*&)?v=|embed/|v/)|youtu\.be/)'
+    r'(?P<id>[a-zA-Z0-9_-]{11})/?(?:[?&#]|$)'
+)
+
+# Cheap pre-checks for validate_youtube_url(): the shortest accepted URL is
+# 'youtu.be/' plus an 11-character ID, and every accepted URL starts with one
+# of these prefixes (compared against the lowercased first 12 characters)
+_YOUTUBE_MIN_URL_LEN = 20
+_YOUTUBE_SCHEMES = ('http://', 'https://')
+_YOUTUBE_URL_PREFIXES = _YOUTUBE_SCHEMES + ('youtube.', 'youtu.be/', 'www.youtube.', 'm.youtube.')
+
+# Characters allowed in an 11-character YouTube video ID
+_YOUTUBE_ID_CHARS = frozenset(string.ascii_letters + string.digits + '_-')
+
+_VIMEO_URL_RE = _url_re.compile(
+    r'vimeo\.com/(?:channels/[\w-]+/|groups/[\w-]+/videos/)?(?P<num>\d+)'
+    r'|player\.vimeo\.com/(?:video/(?P<num2>\d+)|(?P<uuid>[a-f0-9\-]{36}))'
+)
+# Common video file extensions and streaming formats
+_VIDEO_EXTENSIONS = (
+    '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
+    '.m3u8', '.mpd', '.ts', '.m4s'  # Streaming formats
+)
+
+# URL substrings that indicate streams or pages with embedded videos
+_STREAMING_INDICATORS = ('m3u8', 'mpd', 'segments', 'chunks', 'stream')
+_VIDEO_PAGE_INDICATORS = (
+    'watch', 'video', 'play', 'stream', 'embed', 'player',
+    'aula', 'lesson', 'course', 'lecture'  # Educational content
+)
+
+# Both indicator lists and the Vimeo CDN chunk case in one case-insensitive
+# alternation, so the URL is scanned once without lowercasing a copy
+_GENERIC_INDICATOR_RE = re.compile(
+    '|'.join(map(re.escape, dict.fromkeys(_STREAMING_INDICATORS + _VIDEO_PAGE_INDICATORS)))
+    + r'|vod-adaptive-ak\.vimeocdn\.com.*range=',
+    re.IGNORECASE,
+)
+
+# Substrings at least one of which appears in any URL is_generic_video_url() accepts
+_GENERIC_TOKENS = _VIDEO_EXTENSIONS + _STREAMING_INDICATORS + _VIDEO_PAGE_INDICATORS + ('vimeocdn.com',)
+
+_VIMEO_PLAYER_ID_RE = re.compile(r'/video/(\d+)')
+_VIMEO_ID_RE = re.compile(r'vimeo\.com/(\d+)')
+_VIMEO_CHUNK_HOST_RE = re.compile(r'vod-adaptive-ak\.vimeocdn\.com', re.IGNORECASE)
+_VIMEO_ID_CHUNK_RE = re.compile(r'/([a-f0-9-]+)/v2/')
+_VIMEO_RANGE_RE = re.compile(r'range=(\d+)-(\d+)')
+_VIMEO_FILENAME_RE = re.compile(r'/([^/]+\.mp4)')
+_DIGITS_RE = re.compile(r'(\d+)')
+
+# Characters replaced in chunk filenames taken from the URL: path separators,
+# characters Windows rejects, control characters, and '%' (an outtmpl field)
+_BAD_FN_CHARS = re.compile(r'[<>:"/\\|?*%\x00-\x1f]')
+
+# Known yt-dlp error messages, one named group per error kind
+_ERROR_CLASSIFIER_RE = re.compile(
+    r'(?P<format>Requested format is not available)'
+    r'|(?P<auth>HTTP Error 40[13])'
+    r'|(?P<not_found>HTTP Error 404)'
+    r'|(?P<oauth>oauth token)'
+    r'|(?P<embed>embed-only video)'
+    r'|(?P<private>private video)'
+    r'|(?P<unavailable>unavailable)',
+    re.IGNORECASE
+)
+
+# Probe errors no other yt-dlp configuration can get around
+_TERMINAL_ERROR_RE = re.compile(r'private video|video removed|this video is unavailable', re.IGNORECASE)
+
+# test_video_url() error details per kind: (error_type, suggestion, help)
+_PROBE_ERROR_DETAILS = {
+    'oauth': (
+        'oauth_error',
+        'Vimeo OAuth authentication failed. This video may require special permissions or be restricted.',
+        'Try using the webpage URL that embeds this video instead of the direct player URL.'
+    ),
+    'embed': (
+        'embed_only',
+        'This video can only be played when embedded. Find the webpage that shows this video.',
+        'Look for articles or pages that display this video and use that URL instead.'
+    ),
+    'private': (
+        'private',
+        'This video is private and cannot be downloaded.',
+        'Only the video owner can access private videos.'
+    ),
+    'unavailable': (
+        'unavailable',
+        'Video is unavailable. May be deleted, private, or geo-restricted.',
+        'Check if the video exists and is accessible from your location.'
+    ),
+    'general': (
+        'general',
+        'Unknown error occurred. The video may have restrictions or be inaccessible.',
+        'Try a different video URL or check your internet connection.'
+    ),
+}
+
+# download_vimeo_chunk_direct() hints per error kind
+_CHUNK_ERROR_HINTS = {
+    'format': (
+        "💡 This chunk URL might require the full video context.",
+        "🔍 Try to find the original video page that contains this chunk.",
+    ),
+    'auth': (
+        "💡 Authentication/permission error.",
+        "🔍 This chunk might be expired or require specific cookies.",
+    ),
+    'not_found': (
+        "💡 Chunk not found.",
+        "🔍 The chunk URL might be expired or incorrect.",
+    ),
+}
+
+# Maximum number of URL probes run at the same time
+_MAX_PARALLEL_PROBES = 4
+
+# PyPI metadata for yt-dlp; info.version is the latest release
+_PYPI_YTDLP_URL = 'https://pypi.org/pypi/yt-dlp/json'
+
+# URLs that name a whole YouTube playlist (a playlist page, or a video opened from one)
+_PLAYLIST_RE = re.compile(r'youtube\.com/playlist|[?&]list=')
+
+# Playlist probe: list the entries without extracting each video
+_PLAYLIST_PROBE_OPTS = {'quiet': True, 'no_warnings': True, 'extract_flat': 'in_playlist'}
+
+# Domains whose URLs download_videos() counts against YouTube or Vimeo
+_PLATFORM_DOMAINS = {
+    'youtube': ('youtube.com', 'youtu.be', 'youtube-nocookie.com'),
+    'vimeo': ('vimeo.com',),
+}
+
+# Simultaneous download_videos() downloads from one site; more tends to trip
+# per-host rate limiting (YouTube in particular)
+_MAX_DOWNLOADS_PER_HOST = 2
+
+# Options for the cheap HEAD check run before a suggested URL gets a full probe
+_HEAD_PROBE_OPTS = {'quiet': True, 'no_warnings': True, 'socket_timeout': 10}
+
+# HTTP statuses meaning a suggested URL has nothing behind it
+_MISSING_STATUSES = frozenset({404, 410})
+
+# aria2c connections/splits used for progressive (non-segmented) downloads
+_ARIA2C_ARGS = [
+    '-x', '16', '-s', '16', '-k', '1M',
+    '--file-allocation=none',   # Don't pre-write the whole file before downloading
+    '--summary-interval=0',     # yt-dlp shows its own progress
+]
+
+# Only advertise brotli when a decoder is installed, otherwise a br response can't be read
+_ACCEPT_ENCODING = 'gzip, deflate, br' if any(
+    importlib.util.find_spec(module) for module in ('brotli', 'brotlicffi')
+) else 'gzip, deflate'
+
+# Parallel HTTP Range requests a single Vimeo chunk is split into
+_CHUNK_RANGE_SPLITS = 8
+
+# Read block used when copying ranged chunk responses to disk
+_CHUNK_READ_SIZE = 1048576
+
+# Total length in a 206 response's Content-Range header ("bytes 0-99/1234")
+_CONTENT_RANGE_TOTAL_RE = re.compile(r'/(\d+)\s*$')
+
+# Browser-like headers accepted by Vimeo's player CDN
+_VIMEO_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
+    'Accept': '*/*',
+    'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
+    'Accept-Encoding': 'identity',  # Media bytes are already compressed
+    'Referer': 'https://player.vimeo.com/',
+    'Sec-Ch-Ua': '"Chromium";v="139", "Not;A=Brand";v="99"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"macOS"',
+    'Sec-Fetch-Dest': 'empty',
+    'Sec-Fetch-Mode': 'cors',
+    'Sec-Fetch-Site': 'cross-site',
+}
+
+# Desktop Chrome User-Agent shared by several test_video_url() configurations
+_CHROME_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36'
+
+# Minimum seconds between two in-place progress updates
+_PROGRESS_INTERVAL = 0.1
+
+# Throttling state of _progress_hook() per file being downloaded, so concurrent
+# downloads (and the video/audio parts of one) don't suppress each other's updates
+_progress_states: dict[str, dict] = {}
+
+# Percentage step between progress lines when stdout is not a terminal
+_LOG_PROGRESS_STEP = 5
+
+# Formats listed by get_available_formats(), keyed by URL: [timestamp, formats]
+_FORMATS_CACHE_FILE = Path.home() / '.cache' / 'video-downloader' / 'formats.json'
+_FORMATS_CACHE_TTL = 600
+_formats_cache: dict = {}
+
+# Successful test_video_url() results by normalized URL
+_probe_cache: dict = {}
+
+# On-disk copies of those results (one JSON file per URL), kept briefly since
+# the signed stream URLs inside expire
+_PROBE_CACHE_DIR = _FORMATS_CACHE_FILE.parent / 'probes'
+_PROBE_CACHE_TTL = 600
+
+# Info fields never written to the probe cache: they can carry browser cookies
+# and auth headers. yt-dlp recomputes them when the cached info is processed
+_PRIVATE_INFO_KEYS = frozenset({'http_headers', 'cookies'})
+
+# Share-tracking query parameters (besides utm_*) that don't change which video a URL points to
+_TRACKING_PARAMS = frozenset({'si', 'feature', 'pp', 'share', 'fbclid', 'gclid'})
+
+# Idle YoutubeDL instances keyed by their serialized options (see _pooled_ydl)
+_YDL_POOL: dict[str, list] = {}
+_YDL_POOL_LOCK = threading.Lock()
+
+@contextmanager
+def _pooled_ydl(ydl_opts: dict):
+    """
+    Borrows a YoutubeDL instance built with ``ydl_opts`` from a module-level pool.
+
+    Constructing YoutubeDL loads every extractor and sets up cookie jars, so
+    repeated probes with the same options reuse an idle instance instead.
+    An instance is only handed to one caller at a time, which keeps the pool
+    safe for the concurrent probes in the examples.
+
+    Args:
+        ydl_opts (dict): yt-dlp options; callables inside must be module-level
+
+    Yields:
+        yt_dlp.YoutubeDL: Ready-to-use downloader instance
+    """
+    # Imported here rather than at module level: loading yt-dlp's extractors
+    # dominates start-up, and URL validation alone never needs it
+    import yt_dlp
+    
+    key = json.dumps(ydl_opts, sort_keys=True, default=repr)
+    with _YDL_POOL_LOCK:
+        idle = _YDL_POOL.setdefault(key, [])
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        # YoutubeDL fills defaults into the dict it is given (nested ones too),
+        # so hand it a copy and keep shared option constants intact
+        ydl = yt_dlp.YoutubeDL(copy.deepcopy(ydl_opts))
+    try:
+        yield ydl
+    finally:
+        with _YDL_POOL_LOCK:
+            _YDL_POOL[key].append(ydl)
+
+@atexit.register
+def _close_pooled_ydls() -> None:
+    """Closes every pooled YoutubeDL instance so cookie jars are flushed."""
+    with _YDL_POOL_LOCK:
+        instances = [ydl for idle in _YDL_POOL.values() for ydl in idle]
+        _YDL_POOL.clear()
+    for ydl in instances:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+@lru_cache(maxsize=None)
+def _which(tool: str) -> str:
+    """Looks up an executable on $PATH once per process (shutil.which stats every entry)."""
+    return shutil.which(tool)
+
+def _url_host(url: str) -> str:
+    """Returns the network location of a 'scheme://' URL, as urlparse(url).netloc would."""
+    netloc = url.partition('://')[2]
+    for sep in '/?#':
+        netloc = netloc.partition(sep)[0]
+    return netloc
+
+def _hostname(url: str) -> str:
+    """Returns the lowercased host of a URL that may lack its scheme."""
+    return _url_host(url if _SCHEME_RE.match(url) else 'https://' + url).lower()
+
+def _url_path(url: str) -> str:
+    """Returns the path of a URL, as urlparse(url).path would, using plain string splits."""
+    path = url.partition('#')[0].partition('?')[0]
+    if _SCHEME_RE.match(path):
+        rest = path.partition('://')[2]
+        slash = rest.find('/')
+        path = rest[slash:] if slash >= 0 else ''
+    # urlparse() moves ';params' of the last segment out of the path
+    params = path.find(';', path.rfind('/'))
+    return path[:params] if params >= 0 else path
+
+def _version_tuple(version: str) -> tuple:
+    """Turns a version string like '2026.08.19' into comparable ints (2026, 8, 19)."""
+    return tuple(int(part) for part in _DIGITS_RE.findall(version))
 
 def _check_and_update_ytdlp() -> None:
     """
@@ -67,22 +429,32 @@ def _check_and_update_ytdlp() -> None:
     if not should_update:
         return
 
-    print("🔄 Checking for yt-dlp updates (weekly check)...")
+    logger.info("🔄 Checking for yt-dlp updates (weekly check)...")
     try:
+        try:
+            current = importlib.metadata.version('yt-dlp')
+        except importlib.metadata.PackageNotFoundError:
+            current = '0'
+        
+        # One HTTPS request answers the common case; pip only runs for a newer release
+        with urllib.request.urlopen(_PYPI_YTDLP_URL, timeout=10) as response:
+            latest = json.load(response)['info']['version']
+        if _version_tuple(latest) <= _version_tuple(current):
+            logger.info("✅ yt-dlp up to date (v%s)", current)
+            return
+        
         result = subprocess.run(
-            [sys.executable, '-m', 'pip', 'install', '--upgrade', 'yt-dlp', '--quiet'],
+            [sys.executable, '-m', 'pip', 'install', '--upgrade', 'yt-dlp[default]', '--quiet'],
             capture_output=True,
             text=True,
             timeout=30,
         )
         if result.returncode == 0:
-            import importlib.metadata
-            version = importlib.metadata.version('yt-dlp')
-            print(f"✅ yt-dlp up to date (v{version})")
+            logger.info("✅ yt-dlp updated (v%s)", latest)
         else:
-            print(f"⚠️  Could not update yt-dlp: {result.stderr.strip()}")
+            logger.warning("⚠️  Could not update yt-dlp: %s", result.stderr.strip())
     except Exception as e:
-        print(f"⚠️  Update check failed (continuing anyway): {e}")
+        logger.warning("⚠️  Update check failed (continuing anyway): %s", e)
     finally:
         try:
             cache_file.parent.mkdir(parents=True, exist_ok=True)
@@ -98,36 +470,93 @@ def load_cookies_from_browser() -> str:
     Returns:
         str: Path to cookies file if found, None otherwise
     """
-    # Common browser cookie locations
+    # Common browser cookie locations; only the current platform's are checked
     home = Path.home()
-    cookie_paths = [
-        # Chrome/Chromium on macOS
-        home / 'Library/Application Support/Google/Chrome/Default/Cookies',
-        home / 'Library/Application Support/Chromium/Default/Cookies',
-        # Chrome on Linux
-        home / '.config/google-chrome/Default/Cookies',
-        home / '.config/chromium/Default/Cookies',
-        # Firefox on macOS
-        home / 'Library/Application Support/Firefox/Profiles',
-        # Firefox on Linux
-        home / '.mozilla/firefox',
-    ]
-
-    for path in cookie_paths:
+    if sys.platform == 'darwin':
+        support_dir = home / 'Library/Application Support'
+        chrome_paths = [
+            support_dir / 'Google/Chrome/Default/Cookies',
+            support_dir / 'Chromium/Default/Cookies',
+        ]
+        firefox_profiles = support_dir / 'Firefox/Profiles'
+    else:
+        chrome_paths = [
+            home / '.config/google-chrome/Default/Cookies',
+            home / '.config/chromium/Default/Cookies',
+        ]
+        firefox_profiles = home / '.mozilla/firefox'
+
+    # For Chrome/Chromium
+    for path in chrome_paths:
         if path.exists():
-            if 'Firefox' in str(path) or 'firefox' in str(path):
-                # For Firefox, need to find the profile directory
-                if path.is_dir():
-                    for profile_dir in path.iterdir():
-                        if profile_dir.is_dir() and 'default' in profile_dir.name.lower():
-                            cookies_db = profile_dir / 'cookies.sqlite'
-                            if cookies_db.exists():
-                                return str(cookies_db)
-            else:
-                # For Chrome/Chromium
-                return str(path)
+            return str(path)
 
-    return None
+    # For Firefox, the cookies live in the default profile directory
+    # (e.g. 'abcd1234.default-release')
+    cookies_db = next(firefox_profiles.glob('*[Dd]efault*/cookies.sqlite'), None)
+    return str(cookies_db) if cookies_db else None
+
+# Stop events of the probes running on the current thread (see _stoppable)
+_probe_stop = threading.local()
+
+class _ProbeCancelled(Exception):
+    """Raised inside a probe whose result is no longer needed."""
+
+def _stop_events() -> tuple:
+    """Returns the stop events that apply to the current thread's probe."""
+    return getattr(_probe_stop, 'events', ())
+
+@contextmanager
+def _stoppable(events: tuple):
+    """
+    Lets the probe run inside this block give up at its next retry once any of
+    the events is set, instead of retrying for minutes after nobody waits for it.
+    """
+    previous = _stop_events()
+    _probe_stop.events = events
+    try:
+        yield
+    finally:
+        _probe_stop.events = previous
+
+def _call_stoppable(events: tuple, func, *args):
+    """Runs func(*args) under _stoppable(events); meant for executor.submit()."""
+    with _stoppable(events):
+        return func(*args)
+
+def _network_retry_sleep(n: int) -> float:
+    """
+    Exponential backoff with full jitter for network retries, so 429/403 responses
+    can clear and parallel probes/fragments don't retry in lockstep (capped at 60s).
+    
+    yt-dlp passes the zero-based retry number as the keyword argument n. Inside
+    a stoppable probe the wait happens here, and the probe is aborted as soon
+    as it is stopped.
+    """
+    delay = random.uniform(0, min(60, 0.25 * 2 ** n))
+    events = _stop_events()
+    if not events:
+        return delay
+    
+    deadline = time.monotonic() + delay
+    while not any(event.is_set() for event in events):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return 0
+        events[-1].wait(min(remaining, 0.25))
+    raise _ProbeCancelled("probe result no longer needed")
+
+def _file_access_retry_sleep(n: int) -> float:
+    """Linear backoff for file access retries (capped at 10s)."""
+    return min(10, 0.5 * n)
+
+# yt-dlp retry_sleep_functions; module-level so pooled instances keep matching option keys
+_RETRY_SLEEP_FUNCTIONS = {
+    'http': _network_retry_sleep,
+    'fragment': _network_retry_sleep,
+    'extractor': _network_retry_sleep,
+    'file_access': _file_access_retry_sleep,
+}
 
 def get_advanced_youtube_config(cookies_path: str = None, proxy: str = None) -> dict:
     """
@@ -140,6 +569,16 @@ def get_advanced_youtube_config(cookies_path: str = None, proxy: str = None) ->
     Returns:
         dict: Advanced yt-dlp configuration
     """
+    # Add proxy if specified
+    if proxy:
+        logger.info("🌐 Using proxy: %s", proxy)
+    
+    # Deep copy: callers update the dict and yt-dlp fills it in place
+    return copy.deepcopy(_advanced_youtube_config(proxy))
+
+@lru_cache(maxsize=8)
+def _advanced_youtube_config(proxy: str = None) -> dict:
+    """Builds the configuration behind get_advanced_youtube_config(), once per proxy."""
     config = {
         'quiet': True,
         'no_warnings': True,
@@ -154,8 +593,13 @@ def get_advanced_youtube_config(cookies_path: str = None, proxy: str = None) ->
         'fragment_retries': 20,
         'extractor_retries': 10,
         'file_access_retries': 10,
+        'retry_sleep_functions': dict(_RETRY_SLEEP_FUNCTIONS),
         'socket_timeout': 120,
 
+        # Fetch HLS/DASH fragments in parallel; ranged reads for progressive files
+        'concurrent_fragment_downloads': _DEFAULT_CONCURRENT_FRAGMENTS,
+        'http_chunk_size': 10485760,    # 10MB chunks
+
         # Geo-blocking bypass
         'geo_bypass': True,
         'geo_bypass_country': 'US',
@@ -166,44 +610,115 @@ def get_advanced_youtube_config(cookies_path: str = None, proxy: str = None) ->
     }
 
     # Configure JS runtime for n-challenge (needed for yt-dlp 2026+)
-    node_path = shutil.which('node')
+    node_path = _which('node')
     if node_path:
         config['js_runtimes'] = {'node': {'path': node_path}}
 
     # Use cookies directly from Chrome browser (more reliable than cookie file)
     config['cookiesfrombrowser'] = ('chrome',)
 
-    # Add proxy if specified
     if proxy:
         config['proxy'] = proxy
-        print(f"🌐 Using proxy: {proxy}")
 
     return config
 
+def _classify_error(error_str: str, kinds: dict) -> str:
+    """
+    Classifies a yt-dlp error message with a single regex pass.
+
+    Args:
+        error_str (str): Error message to classify
+        kinds (dict): Error kinds the caller handles, highest priority first
+
+    Returns:
+        str: First kind in ``kinds`` found in the message, or '' if none is
+    """
+    found = {match.lastgroup for match in _ERROR_CLASSIFIER_RE.finditer(error_str)}
+    return next((kind for kind in kinds if kind in found), '')
+
+def _write_progress(line: str) -> None:
+    """Writes an in-place progress line straight to stdout and flushes it."""
+    sys.stdout.write(line)
+    sys.stdout.flush()
+
+def _progress_percent(d: dict) -> float:
+    """Returns the completion percentage of a 'downloading' progress event, or None if unknown."""
+    if 'fragment_index' in d and d.get('fragment_count'):
+        return d['fragment_index'] / d['fragment_count'] * 100
+    total = d.get('total_bytes') or d.get('total_bytes_estimate')
+    if not total:
+        return None
+    return d.get('downloaded_bytes', 0) / total * 100
+
 def _progress_hook(d):
     """
     Progress hook for yt-dlp downloads, specially optimized for segmented videos.
     
+    yt-dlp calls this for every received block/fragment, so 'downloading' updates
+    are rate-limited to one per _PROGRESS_INTERVAL and skipped when the line
+    would not change; the last fragment and the 'finished'/'error' events are
+    always printed. When stdout is not a terminal, a line is only written
+    every _LOG_PROGRESS_STEP percent.
+    
     Args:
         d (dict): Download progress information from yt-dlp
     """
     if d['status'] == 'downloading':
+        state = _progress_states.setdefault(d.get('filename'), {'last_update': 0.0, 'last_line': '', 'last_step': -1})
+        now = time.monotonic()
+        is_last_fragment = 'fragment_index' in d and d['fragment_index'] == d.get('fragment_count')
+        if now - state['last_update'] < _PROGRESS_INTERVAL and not is_last_fragment:
+            return
+        
         if 'fragment_index' in d and 'fragment_count' in d:
             # For segmented/chunked videos (like HLS, DASH)
             fragment_current = d['fragment_index']
             fragment_total = d['fragment_count']
             percent = (fragment_current / fragment_total) * 100
-            print(f"\r🔗 Downloading chunk {fragment_current}/{fragment_total} ({percent:.1f}%)", end='', flush=True)
+            line = f"🔗 Downloading chunk {fragment_current}/{fragment_total} ({percent:.1f}%)"
         elif '_percent_str' in d:
             # For regular downloads with percentage
-            print(f"\r📥 Downloading: {d['_percent_str'].strip()}", end='', flush=True)
+            line = f"📥 Downloading: {d['_percent_str'].strip()}"
         elif '_total_bytes_str' in d and '_downloaded_bytes_str' in d:
             # For downloads with size information
-            print(f"\r📥 Downloaded: {d['_downloaded_bytes_str']} / {d['_total_bytes_str']}", end='', flush=True)
-    elif d['status'] == 'finished':
-        print(f"\n✅ Download finished: {d['filename']}")
-    elif d['status'] == 'error':
-        print(f"\n❌ Download error: {d.get('error', 'Unknown error')}")
+            line = f"📥 Downloaded: {d['_downloaded_bytes_str']} / {d['_total_bytes_str']}"
+        else:
+            return
+        
+        if not sys.stdout.isatty():
+            # Pipes and log files can't redraw a line in place, so emit one
+            # plain line per _LOG_PROGRESS_STEP percent instead
+            percent = _progress_percent(d)
+            if percent is None:
+                return
+            step = int(percent // _LOG_PROGRESS_STEP)
+            if step == state['last_step']:
+                return
+            state['last_update'] = now
+            state['last_step'] = step
+            _write_progress(line + '\n')
+            return
+        
+        line = '\r' + line
+        
+        # Repainting an identical line only costs a write and a flush
+        if line == state['last_line']:
+            return
+        state['last_update'] = now
+        state['last_line'] = line
+        _write_progress(line)
+    else:
+        # The next file (e.g. the audio stream after the video) starts from a clean slate
+        state = _progress_states.pop(d.get('filename'), None)
+        
+        # End the in-place progress line on stdout, or the next stdout output
+        # (and the shell prompt) would be appended to it
+        if state and state['last_line'] and sys.stdout.isatty():
+            _write_progress('\n')
+        if d['status'] == 'finished':
+            logger.info("✅ Download finished: %s", d['filename'])
+        elif d['status'] == 'error':
+            logger.error("❌ Download error: %s", d.get('error', 'Unknown error'))
 
 def try_alternative_extraction_methods(url: str) -> list[str]:
     """
@@ -220,7 +735,7 @@ def try_alternative_extraction_methods(url: str) -> list[str]:
     # For Vimeo embed URLs
     if 'player.vimeo.com' in url:
         # Extract video ID and create standard Vimeo URL
-        vimeo_id_match = re.search(r'/video/(\d+)', url)
+        vimeo_id_match = _VIMEO_PLAYER_ID_RE.search(url)
         if vimeo_id_match:
             video_id = vimeo_id_match.group(1)
             alternatives.append(f"https://vimeo.com/{video_id}")
@@ -228,7 +743,7 @@ def try_alternative_extraction_methods(url: str) -> list[str]:
     
     # For standard Vimeo URLs, try embed format
     elif 'vimeo.com' in url and '/video/' not in url:
-        vimeo_id_match = re.search(r'vimeo\.com/(\d+)', url)
+        vimeo_id_match = _VIMEO_ID_RE.search(url)
         if vimeo_id_match:
             video_id = vimeo_id_match.group(1)
             alternatives.append(f"https://player.vimeo.com/video/{video_id}")
@@ -245,26 +760,33 @@ def detect_vimeo_chunk(url: str) -> dict:
     Returns:
         dict: Chunk information or empty dict if not a chunk
     """
-    if 'vod-adaptive-ak.vimeocdn.com' not in url.lower():
+    # Copy so callers can't mutate the memoized result
+    return dict(_detect_vimeo_chunk(url))
+
+@lru_cache(maxsize=256)
+def _detect_vimeo_chunk(url: str) -> dict:
+    """Uncached chunk detection behind detect_vimeo_chunk()."""
+    # Case-insensitive scan instead of lowercasing a copy of every URL
+    if not _VIMEO_CHUNK_HOST_RE.search(url):
         return {}
     
     # Extract chunk information
     chunk_info = {'is_chunk': True, 'original_url': url}
     
     # Extract video ID from path
-    video_id_match = re.search(r'/([a-f0-9-]+)/v2/', url)
+    video_id_match = _VIMEO_ID_CHUNK_RE.search(url)
     if video_id_match:
         chunk_info['video_id'] = video_id_match.group(1)
     
     # Extract range information
-    range_match = re.search(r'range=(\d+)-(\d+)', url)
+    range_match = _VIMEO_RANGE_RE.search(url)
     if range_match:
         chunk_info['range_start'] = int(range_match.group(1))
         chunk_info['range_end'] = int(range_match.group(2))
         chunk_info['chunk_size'] = chunk_info['range_end'] - chunk_info['range_start']
     
     # Extract file name
-    filename_match = re.search(r'/([^/]+\.mp4)', url)
+    filename_match = _VIMEO_FILENAME_RE.search(url)
     if filename_match:
         chunk_info['filename'] = filename_match.group(1)
     
@@ -280,19 +802,7 @@ def create_vimeo_direct_download_config() -> dict:
     return {
         'format': 'best',
         'outtmpl': '%(title)s_chunk.%(ext)s',
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-            'Accept': '*/*',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Referer': 'https://player.vimeo.com/',
-            'Sec-Ch-Ua': '"Chromium";v="139", "Not;A=Brand";v="99"',
-            'Sec-Ch-Ua-Mobile': '?0',
-            'Sec-Ch-Ua-Platform': '"macOS"',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'cross-site',
-        },
+        'http_headers': dict(_VIMEO_HEADERS),
         # Bypass format selection issues
         'ignoreerrors': False,
         'no_warnings': False,
@@ -304,6 +814,105 @@ def create_vimeo_direct_download_config() -> dict:
         'force_url': True,
     }
 
+def _fetch_chunk_range(ydl, url: str, file_path: str, start: int, end: int) -> int:
+    """
+    Fetches bytes start..end (inclusive) of a URL into the same offsets of a file.
+    
+    Args:
+        ydl: YoutubeDL instance whose connections and headers are reused
+        url (str): URL to fetch
+        file_path (str): Existing file to write into
+        start (int): First byte offset
+        end (int): Last byte offset
+        
+    Returns:
+        int: Total size from Content-Range, or 0 if the server ignored the Range header
+    """
+    from yt_dlp.networking import Request
+    
+    with ydl.urlopen(Request(url, headers={'Range': f'bytes={start}-{end}'})) as response:
+        if response.status != 206:
+            return 0
+        total_match = _CONTENT_RANGE_TOTAL_RE.search(response.headers.get('Content-Range', ''))
+        with open(file_path, 'r+b') as f:
+            if hasattr(os, 'posix_fadvise'):
+                # Each worker writes its own range front to back (Linux/BSD only)
+                os.posix_fadvise(f.fileno(), start, end - start + 1, os.POSIX_FADV_SEQUENTIAL)
+            f.seek(start)
+            shutil.copyfileobj(response, f, _CHUNK_READ_SIZE)
+    
+    return int(total_match.group(1)) if total_match else 0
+
+def _download_chunk_ranges(ydl, url: str, file_path: str, size: int) -> bool:
+    """
+    Downloads a chunk as parallel HTTP Range requests, each written at its own offset.
+    
+    Args:
+        ydl: YoutubeDL instance whose connections and headers are reused
+        url (str): Vimeo CDN chunk URL
+        file_path (str): Destination file
+        size (int): Expected chunk size in bytes
+        
+    Returns:
+        bool: True if the whole chunk was written, False if it must be downloaded another way
+    """
+    from yt_dlp.networking.exceptions import RequestError
+    
+    piece = -(-size // _CHUNK_RANGE_SPLITS)
+    ranges = [(start, min(start + piece, size) - 1) for start in range(0, size, piece)]
+    
+    # Workers open the file themselves and write only their own byte range;
+    # reserving the whole size up front keeps the blocks contiguous
+    with open(file_path, 'wb') as f:
+        if hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(f.fileno(), 0, size)
+            except OSError:
+                pass  # Not supported by this filesystem
+    try:
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            totals = set(executor.map(lambda r: _fetch_chunk_range(ydl, url, file_path, *r), ranges))
+    except (RequestError, OSError) as e:
+        logger.debug("Ranged chunk download failed: %s", e)
+        totals = {0}
+    
+    # Every piece must be a 206 of the same resource, no larger than what was requested
+    total = totals.pop() if len(totals) == 1 else 0
+    if not 0 < total <= size:
+        os.remove(file_path)
+        return False
+    
+    if total < size:
+        os.truncate(file_path, total)
+    return True
+
+def _stream_chunk(ydl, url: str, file_path: str) -> bool:
+    """
+    Streams a chunk to disk with a single GET, skipping yt-dlp's extractor pipeline.
+    
+    Args:
+        ydl: YoutubeDL instance whose connections and headers are reused
+        url (str): Vimeo CDN chunk URL
+        file_path (str): Destination file
+        
+    Returns:
+        bool: True if the chunk was written, False if the request failed
+    """
+    from yt_dlp.networking.exceptions import RequestError
+    
+    try:
+        with ydl.urlopen(url) as response, open(file_path, 'wb') as f:
+            shutil.copyfileobj(response, f, _CHUNK_READ_SIZE)
+        return True
+    except (RequestError, OSError) as e:
+        logger.debug("Streaming chunk download failed: %s", e)
+        # Don't leave a partial file for yt-dlp to mistake for a finished download
+        try:
+            os.remove(file_path)
+        except OSError:
+            pass
+        return False
+
 def download_vimeo_chunk_direct(url: str, output_path: str, chunk_info: dict) -> bool:
     """
     Downloads a Vimeo CDN chunk directly using yt-dlp with optimized settings.
@@ -316,90 +925,92 @@ def download_vimeo_chunk_direct(url: str, output_path: str, chunk_info: dict) ->
     Returns:
         bool: True if download was successful, False otherwise
     """
-    print(f"🚀 Attempting direct chunk download...")
+    import yt_dlp
+    
+    logger.info("🚀 Attempting direct chunk download...")
     
     # Create output directory if needed
-    if not os.path.exists(output_path):
-        try:
-            os.makedirs(output_path, exist_ok=True)
-            print(f"📁 Directory created: {output_path}")
-        except OSError as e:
-            print(f"❌ Error creating directory {output_path}: {e}")
-            return False
+    try:
+        os.makedirs(output_path)
+        logger.info("📁 Directory created: %s", output_path)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.error("❌ Error creating directory %s: %s", output_path, e)
+        return False
     
     # Generate filename based on chunk info
     filename = chunk_info.get('filename', 'vimeo_chunk.mp4')
     if 'range_start' in chunk_info and 'range_end' in chunk_info:
         name_base = filename.replace('.mp4', '')
         filename = f"{name_base}_chunk_{chunk_info['range_start']}-{chunk_info['range_end']}.mp4"
+    # The name comes straight from the URL and bypasses yt-dlp's sanitizer,
+    # both as the direct-write path and as a literal output template
+    filename = _BAD_FN_CHARS.sub('_', filename)
     
     # Configure yt-dlp for direct chunk download
     ydl_opts = {
         'format': 'best',
         'outtmpl': os.path.join(output_path, filename),
-        'http_headers': {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36',
-            'Accept': '*/*',
-            'Accept-Language': 'pt-BR,pt;q=0.9,en-US;q=0.8,en;q=0.7',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Referer': 'https://player.vimeo.com/',
-            'Sec-Ch-Ua': '"Chromium";v="139", "Not;A=Brand";v="99"',
-            'Sec-Ch-Ua-Mobile': '?0',
-            'Sec-Ch-Ua-Platform': '"macOS"',
-            'Sec-Fetch-Dest': 'empty',
-            'Sec-Fetch-Mode': 'cors',
-            'Sec-Fetch-Site': 'cross-site',
-        },
+        'http_headers': dict(_VIMEO_HEADERS),
         # Skip format extraction issues
         'extract_flat': False,
         'ignoreerrors': True,
         'no_warnings': False,
         'retries': 10,
+        'fragment_retries': 15,
+        'extractor_retries': 5,
+        'retry_sleep_functions': dict(_RETRY_SLEEP_FUNCTIONS),
         'socket_timeout': 30,
+        
+        # Fetch segments in parallel over the pooled keep-alive connections
+        'concurrent_fragment_downloads': _DEFAULT_CONCURRENT_FRAGMENTS,
+        'http_chunk_size': 10485760,    # 10MB chunks
+        'buffersize': 1048576,          # 1MB initial read block (yt-dlp starts at 1KB)
+        'hls_prefer_native': True,
+        
         'progress_hooks': [_progress_hook],
     }
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"📥 Downloading chunk: {filename}")
-            print(f"🔗 Source: {url[:100]}...")
+        with _pooled_ydl(ydl_opts) as ydl:
+            logger.info("📥 Downloading chunk: %s", filename)
+            logger.info("🔗 Source: %s...", url[:100])
             
-            # Download the chunk
-            ydl.download([url])
+            # Split a known byte range across parallel requests, else stream it
+            # with one plain GET; the full yt-dlp pipeline is the last resort
+            file_path = os.path.join(output_path, filename)
+            if 'chunk_size' in chunk_info and _download_chunk_ranges(ydl, url, file_path, chunk_info['chunk_size'] + 1):
+                logger.info("⚡ Fetched in parallel byte ranges")
+            elif not _stream_chunk(ydl, url, file_path):
+                ydl.download([url])
             
-            print(f"✅ Chunk downloaded successfully!")
-            print(f"📂 File: {os.path.join(output_path, filename)}")
+            logger.info("✅ Chunk downloaded successfully!")
+            logger.info("📂 File: %s", file_path)
             
             # Show chunk information
-            print(f"\n📊 Chunk Information:")
-            print(f"   📦 Size: {chunk_info.get('chunk_size', 'unknown')} bytes")
-            print(f"   📋 Range: {chunk_info.get('range_start', '?')}-{chunk_info.get('range_end', '?')}")
+            logger.info("\n📊 Chunk Information:")
+            logger.info("   📦 Size: %s bytes", chunk_info.get('chunk_size', 'unknown'))
+            logger.info("   📋 Range: %s-%s", chunk_info.get('range_start', '?'), chunk_info.get('range_end', '?'))
             if 'video_id' in chunk_info:
-                print(f"   🎬 Video ID: {chunk_info['video_id']}")
+                logger.info("   🎬 Video ID: %s", chunk_info['video_id'])
             
             return True
             
     except yt_dlp.DownloadError as e:
         error_str = str(e)
-        print(f"❌ Download error: {error_str}")
+        logger.error("❌ Download error: %s", error_str)
         
         # Provide specific suggestions for chunk download issues
-        if "Requested format is not available" in error_str:
-            print("💡 This chunk URL might require the full video context.")
-            print("🔍 Try to find the original video page that contains this chunk.")
-            
-        elif "HTTP Error 403" in error_str or "HTTP Error 401" in error_str:
-            print("💡 Authentication/permission error.")
-            print("🔍 This chunk might be expired or require specific cookies.")
-            
-        elif "HTTP Error 404" in error_str:
-            print("💡 Chunk not found.")
-            print("🔍 The chunk URL might be expired or incorrect.")
+        kind = _classify_error(error_str, _CHUNK_ERROR_HINTS)
+        if kind:
+            for hint in _CHUNK_ERROR_HINTS[kind]:
+                logger.info(hint)
             
         return False
         
     except Exception as e:
-        print(f"❌ Unexpected error: {str(e)}")
+        logger.error("❌ Unexpected error: %s", e)
         return False
 
 def suggest_full_video_from_chunk(chunk_info: dict) -> list[str]:
@@ -424,8 +1035,8 @@ def suggest_full_video_from_chunk(chunk_info: dict) -> list[str]:
             f"https://player.vimeo.com/video/{video_id}",
         ])
         
-        # Try to extract numeric ID if present
-        numeric_match = re.search(r'(\d+)', video_id)
+        # Try to extract numeric ID if present; an all-digit ID was covered above
+        numeric_match = None if video_id.isdigit() else _DIGITS_RE.search(video_id)
         if numeric_match:
             numeric_id = numeric_match.group(1)
             suggestions.extend([
@@ -435,6 +1046,31 @@ def suggest_full_video_from_chunk(chunk_info: dict) -> list[str]:
     
     return suggestions
 
+def _probe_suggestion(url: str) -> tuple[bool, dict]:
+    """
+    Probes a suggested full-video URL, skipping test_video_url() when a HEAD request finds nothing.
+    
+    Args:
+        url (str): Suggested video URL
+        
+    Returns:
+        tuple[bool, dict]: Same as test_video_url()
+    """
+    from yt_dlp.networking import Request
+    from yt_dlp.networking.exceptions import HTTPError, RequestError
+    
+    # One request over the pooled connections instead of up to five extractions
+    try:
+        with _pooled_ydl(_HEAD_PROBE_OPTS) as ydl:
+            ydl.urlopen(Request(url, method='HEAD')).close()
+    except HTTPError as e:
+        if e.status in _MISSING_STATUSES:
+            return False, {'error': str(e)}
+    except RequestError:
+        pass  # Let the full probe report connection problems
+    
+    return test_video_url(url)
+
 def try_download_full_video_from_chunk(url: str, output_path: str) -> bool:
     """
     Attempts to find and download the full video from a chunk URL.
@@ -463,32 +1099,55 @@ def try_download_full_video_from_chunk(url: str, output_path: str) -> bool:
     
     print(f"🔗 Trying {len(suggestions)} possible full video URLs...")
     
-    for i, suggested_url in enumerate(suggestions, 1):
-        print(f"\n🔍 Attempt {i}: {suggested_url}")
-        
-        # Test if URL is accessible
-        success, info = test_video_url(suggested_url)
-        
-        if success:
-            print(f"✅ Found accessible video!")
-            print(f"📺 Title: {info.get('title', 'N/A')}")
+    # The suggestions are independent probes, so test them all at once and
+    # handle each one as soon as its answer arrives
+    stop = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_PROBES, len(suggestions)))
+    futures = {
+        executor.submit(_call_stoppable, (stop,), _probe_suggestion, suggested_url): suggested_url
+        for suggested_url in suggestions
+    }
+    chosen_url = chosen_info = None
+    
+    try:
+        for i, future in enumerate(as_completed(futures), 1):
+            suggested_url = futures[future]
+            print(f"\n🔍 Attempt {i}: {suggested_url}")
             
-            # Ask user if they want to download this
-            print(f"\n💡 This might be the full video containing your chunk.")
-            download_choice = input("💾 Download this full video? (y/N): ").strip().lower()
+            success, info = future.result()
             
-            if download_choice in ['y', 'yes']:
-                print(f"🚀 Downloading full video...")
-                return download_video(suggested_url, output_path, 'best[height<=720]')
+            if success:
+                print(f"✅ Found accessible video!")
+                print(f"📺 Title: {info.get('title', 'N/A')}")
+                
+                # Ask user if they want to download this
+                print(f"\n💡 This might be the full video containing your chunk.")
+                download_choice = input("💾 Download this full video? (y/N): ").strip().lower()
+                
+                if download_choice in ['y', 'yes']:
+                    chosen_url, chosen_info = suggested_url, info
+                    break
+                else:
+                    print("⏭️ Skipping this video...")
+                    continue
             else:
-                print("⏭️ Skipping this video...")
-                continue
-        else:
-            print(f"❌ Not accessible: {info.get('error', 'Unknown error')[:50]}...")
+                print(f"❌ Not accessible: {info.get('error', 'Unknown error')[:50]}...")
+    finally:
+        # Drop probes that haven't started, make the running ones give up at
+        # their next retry, and don't wait for them here
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    
+    if chosen_url:
+        print(f"🚀 Downloading full video...")
+        return download_video(chosen_url, output_path, 'best[height<=720]', info=chosen_info)
     
     print("❌ Could not find the full video from chunk information")
     return False
 
+@lru_cache(maxsize=256)
 def validate_vimeo_url(url: str) -> bool:
     """
     Validates if a URL is a valid Vimeo video URL.
@@ -509,42 +1168,24 @@ def validate_vimeo_url(url: str) -> bool:
         >>> validate_vimeo_url('https://example.com')
         False
     """
-    # Vimeo URL patterns
-    vimeo_patterns = [
-        r'vimeo\.com/(\d+)',
-        r'player\.vimeo\.com/video/(\d+)',
-        r'player\.vimeo\.com/([a-f0-9\-]{36})',  # For URLs like the one you mentioned
-        r'vimeo\.com/channels/[\w-]+/(\d+)',
-        r'vimeo\.com/groups/[\w-]+/videos/(\d+)',
-    ]
-    
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme:
+        # Check URL pattern first: it is cheaper than parsing and rejects most URLs
+        # Vimeo video IDs can be numeric or UUID format, which the pattern enforces
+        if _VIMEO_URL_RE.search(url) is None:
+            return False
+        
+        if not _SCHEME_RE.match(url):
             url = 'https://' + url
-            parsed = urlparse(url)
         
         # Check if it's a Vimeo domain
-        valid_domains = ['vimeo.com', 'www.vimeo.com', 'player.vimeo.com']
-        if parsed.netloc not in valid_domains:
-            return False
-        
-        # Check URL pattern and extract video ID
-        for pattern in vimeo_patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                # Vimeo video IDs can be numeric or UUID format
-                if video_id.isdigit() or len(video_id) == 36:  # UUID length
-                    return True
-                
-        return False
+        return _url_host(url) in _VIMEO_DOMAINS
     except Exception:
         return False
 
 def detect_platform(url: str) -> str:
     """
     Detects the video platform from URL.
+    Results are memoized, so re-checking the same URL costs a dict lookup.
     
     Args:
         url (str): Video URL to analyze
@@ -565,15 +1206,32 @@ def detect_platform(url: str) -> str:
         >>> detect_platform('https://example.com')
         'unknown'
     """
-    if validate_youtube_url(url):
+    return _detect_platform(url.strip())
+
+@lru_cache(maxsize=512)
+def _detect_platform(url: str) -> str:
+    """Uncached platform detection behind detect_platform()."""
+    # A valid YouTube/Vimeo URL always contains its domain, so one regex scan
+    # tells which (if any) of the platform validators is worth running
+    hints = {match.lastgroup for match in _PLATFORM_HINT_RE.finditer(url)}
+    
+    # Most unrelated URLs contain none of the generic tokens either, so plain
+    # substring tests settle them without parsing the URL
+    if not hints:
+        lowered = url.lower()
+        if not any(token in lowered for token in _GENERIC_TOKENS):
+            return 'unknown'
+    
+    if 'youtube' in hints and validate_youtube_url(url):
         return 'youtube'
-    elif validate_vimeo_url(url):
+    elif 'vimeo' in hints and validate_vimeo_url(url):
         return 'vimeo'
     elif is_generic_video_url(url):
         return 'generic'
     else:
         return 'unknown'
 
+@lru_cache(maxsize=256)
 def is_generic_video_url(url: str) -> bool:
     """
     Checks if URL might be a generic video URL (including segmented videos).
@@ -584,46 +1242,14 @@ def is_generic_video_url(url: str) -> bool:
     Returns:
         bool: True if URL appears to be a video, False otherwise
     """
-    # Common video file extensions and streaming formats
-    video_extensions = [
-        '.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm',
-        '.m3u8', '.mpd', '.ts', '.m4s'  # Streaming formats
-    ]
-    
     # Check if URL ends with video extension
-    parsed_url = urlparse(url.lower())
-    path = parsed_url.path
-    
-    for ext in video_extensions:
-        if path.endswith(ext):
-            return True
-    
-    # Check for common streaming indicators in URL
-    streaming_indicators = ['m3u8', 'mpd', 'segments', 'chunks', 'stream']
-    for indicator in streaming_indicators:
-        if indicator in url.lower():
-            return True
-    
-    # Special case: Vimeo CDN chunks
-    if 'vod-adaptive-ak.vimeocdn.com' in url.lower() and 'range=' in url.lower():
+    if _url_path(url).lower().endswith(_VIDEO_EXTENSIONS):
         return True
     
-    # Special case: VideoAddress embed pages (contain embedded videos)
-    if 'videoaddress.com.br' in url.lower() and ('aula' in url.lower() or 'video' in url.lower()):
-        return True
-    
-    # Generic check: URLs that might contain embedded videos
-    # Check for common patterns that indicate video content pages
-    video_page_indicators = [
-        'watch', 'video', 'play', 'stream', 'embed', 'player',
-        'aula', 'lesson', 'course', 'lecture'  # Educational content
-    ]
-    
-    for indicator in video_page_indicators:
-        if indicator in url.lower():
-            return True
-    
-    return False
+    # Check for streaming indicators, common patterns that indicate video content
+    # pages (URLs that might contain embedded videos) and Vimeo CDN chunks.
+    # VideoAddress embed pages need 'aula' or 'video', so they match here too
+    return _GENERIC_INDICATOR_RE.search(url) is not None
 
 def validate_video_url(url: str) -> bool:
     """
@@ -637,6 +1263,7 @@ def validate_video_url(url: str) -> bool:
     """
     return validate_youtube_url(url) or validate_vimeo_url(url) or is_generic_video_url(url)
 
+@lru_cache(maxsize=256)
 def validate_youtube_url(url: str) -> bool:
     """
     Validates if a URL is a valid YouTube video URL.
@@ -654,36 +1281,204 @@ def validate_youtube_url(url: str) -> bool:
         >>> validate_youtube_url('https://example.com')
         False
     """
-    # YouTube URL patterns
-    youtube_patterns = [
-        r'(?:youtube\.com/watch\?v=|youtube\.com/embed/|youtu\.be/|youtube\.com/v/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/watch\?.*[&?]v=([a-zA-Z0-9_-]{11})',
-    ]
-    
     try:
-        parsed = urlparse(url)
-        if not parsed.scheme:
-            url = 'https://' + url
-            parsed = urlparse(url)
+        # Pasted URLs often carry surrounding spaces; detect_platform() ignores them too
+        url = url.strip()
         
-        # Check if it's a YouTube domain
-        valid_domains = ['youtube.com', 'www.youtube.com', 'youtu.be', 'm.youtube.com']
-        if parsed.netloc not in valid_domains:
+        # Reject too-short URLs and foreign prefixes before parsing anything
+        if len(url) < _YOUTUBE_MIN_URL_LEN:
+            return False
+        head = url[:12].lower()
+        if not head.startswith(_YOUTUBE_URL_PREFIXES):
             return False
         
-        # Check URL pattern and extract video ID
-        for pattern in youtube_patterns:
-            match = re.search(pattern, url)
-            if match:
-                video_id = match.group(1)
-                # YouTube video IDs are exactly 11 characters long
-                if len(video_id) == 11:
-                    return True
-                
-        return False
+        if not head.startswith(_YOUTUBE_SCHEMES):
+            url = 'https://' + url
+        
+        # Check if it's a YouTube domain, then that the URL carries a video ID
+        return _url_host(url) in _YOUTUBE_DOMAINS and _youtube_video_id(url) is not None
     except Exception:
         return False
 
+def _query_param(url: str, name: str) -> str:
+    """Returns the first value of a query parameter, or '' if the URL doesn't have it."""
+    for param in url.partition('#')[0].partition('?')[2].split('&'):
+        key, _, value = param.partition('=')
+        if key == name:
+            return value
+    return ''
+
+def _youtube_video_id(url: str) -> Optional[str]:
+    """
+    Returns the 11-character video ID of a 'scheme://' YouTube URL, or None.
+    
+    The watch, youtu.be, embed and v/ shapes are read with string splits; the
+    anchored URL regex only runs when that finds no valid ID.
+    """
+    # A single trailing slash (youtu.be/<id>/) doesn't change the video
+    path = _url_path(url)
+    if path.endswith('/'):
+        path = path[:-1]
+    video_id = ''
+    if _url_host(url) == 'youtu.be':
+        video_id = path[1:]
+    elif path == '/watch':
+        video_id = _query_param(url, 'v')
+    elif path.startswith(('/embed/', '/v/')):
+        video_id = path[path.find('/', 1) + 1:]
+    
+    # YouTube video IDs are exactly 11 characters long
+    if len(video_id) == 11 and _YOUTUBE_ID_CHARS.issuperset(video_id):
+        return video_id
+    match = _YOUTUBE_URL_RE.match(url)
+    return match.group('id') if match else None
+
+def _normalize_url(url: str) -> str:
+    """Drops the fragment and tracking query parameters so equivalent links share a cache entry."""
+    base, _, query = url.partition('#')[0].partition('?')
+    params = []
+    for param in query.split('&'):
+        name = param.partition('=')[0]
+        if name and name not in _TRACKING_PARAMS and not name.startswith('utm_'):
+            params.append(param)
+    return f"{base}?{'&'.join(params)}" if params else base
+
+def _cache_key(url: str) -> str:
+    """
+    Returns the key under which probe and format results for a URL are cached.
+    
+    YouTube links are keyed by video ID, so youtu.be, watch, embed and
+    timestamped links to one video share their entries; other URLs are keyed
+    by their normalized form. A list= parameter is part of the key, since
+    such URLs are probed as playlists (see _PLAYLIST_RE).
+    """
+    url = url.strip()
+    if validate_youtube_url(url):
+        url = url if _SCHEME_RE.match(url) else 'https://' + url
+        cache_key = f"youtube:{_youtube_video_id(url)}"
+        list_id = _query_param(url, 'list')
+        return f"{cache_key}:list={list_id}" if list_id else cache_key
+    return _normalize_url(url)
+
+def _load_formats_cache() -> dict:
+    """Returns the format cache, reading it from disk on first use."""
+    if not _formats_cache:
+        try:
+            with open(_FORMATS_CACHE_FILE, encoding='utf-8') as f:
+                _formats_cache.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+    return _formats_cache
+
+def _store_formats(url: str, formats: list) -> None:
+    """Caches the formats of a URL and rewrites the on-disk cache without expired entries."""
+    now = time.time()
+    _formats_cache[url] = [now, [dict(fmt) for fmt in formats]]
+    for key in [key for key, (stamp, _) in _formats_cache.items() if now - stamp >= _FORMATS_CACHE_TTL]:
+        del _formats_cache[key]
+    
+    try:
+        _FORMATS_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = _FORMATS_CACHE_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(_formats_cache, f)
+        os.replace(tmp_file, _FORMATS_CACHE_FILE)
+    except OSError:
+        pass  # The cache is only an optimization
+
+def _probe_cache_file(cache_key: str) -> Path:
+    """Returns the disk cache file holding the probe result for a cache key."""
+    return _PROBE_CACHE_DIR / f"{hashlib.blake2b(cache_key.encode(), digest_size=8).hexdigest()}.json"
+
+def _load_probe(cache_key: str) -> dict:
+    """Returns the probe result cached on disk under a cache key, or None if missing or expired."""
+    cache_file = _probe_cache_file(cache_key)
+    try:
+        if time.time() - cache_file.stat().st_mtime >= _PROBE_CACHE_TTL:
+            return None
+        with open(cache_file, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _store_probe(cache_key: str, info: dict) -> None:
+    """Writes a probe result to the disk cache and removes expired entries."""
+    now = time.time()
+    try:
+        # Signed stream URLs are still inside, so only the user may read the cache
+        _PROBE_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(_PROBE_CACHE_DIR, 0o700)
+        for old_file in _PROBE_CACHE_DIR.glob('*.json'):
+            if now - old_file.stat().st_mtime >= _PROBE_CACHE_TTL:
+                old_file.unlink()
+        
+        # Info holding generators or callables (e.g. live fragment lists) can't
+        # survive a JSON round trip, so it is only cached in memory
+        data = json.dumps(_strip_private_fields(info))
+        
+        cache_file = _probe_cache_file(cache_key)
+        tmp_file = cache_file.with_suffix('.tmp')
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        pass  # The cache is only an optimization
+
+def _strip_private_fields(value):
+    """Copies an info dict without its _PRIVATE_INFO_KEYS, at any depth (e.g. per format)."""
+    if isinstance(value, dict):
+        return {key: _strip_private_fields(item) for key, item in value.items()
+                if key not in _PRIVATE_INFO_KEYS}
+    if isinstance(value, list):
+        return [_strip_private_fields(item) for item in value]
+    return value
+
+def _filter_video_formats(formats: list) -> list:
+    """
+    Keeps one video format per resolution, in the shape shown by get_user_format_choice().
+    
+    Args:
+        formats (list): Format dicts as found in yt-dlp's info['formats']
+        
+    Returns:
+        list: Video formats sorted by resolution (highest first)
+    """
+    # Filter video formats and organize by resolution. Unprocessed extractor
+    # results aren't sorted by quality, so the best format of each height is
+    # picked explicitly: highest bitrate, then largest (approximate) size
+    by_height = {}
+    best_quality = {}
+    ascending = True
+    last_height = 0
+    
+    for fmt in formats:
+        height = fmt.get('height')
+        if not height or fmt.get('vcodec') == 'none':
+            continue
+        quality = (fmt.get('tbr') or 0, fmt.get('filesize') or fmt.get('filesize_approx') or 0)
+        if height in by_height:
+            if quality <= best_quality[height]:
+                continue
+        else:
+            ascending = ascending and height > last_height
+            last_height = height
+        best_quality[height] = quality
+        by_height[height] = {
+            'format_id': fmt.get('format_id'),
+            'resolution': f"{fmt.get('width', 'N/A')}x{height}",
+            'height': height,
+            'ext': fmt.get('ext', 'mp4'),
+            'filesize': fmt.get('filesize') or 0
+        }
+    
+    # Highest resolution first. Heights usually first appear from worst to
+    # best, in which case reversing the insertion order is enough (replacing
+    # a height's format keeps its position)
+    if ascending:
+        return list(reversed(by_height.values()))
+    return sorted(by_height.values(), key=itemgetter('height'), reverse=True)
+
 def get_available_formats(url: str) -> list:
     """
     Gets available video formats for a YouTube URL.
@@ -693,39 +1488,45 @@ def get_available_formats(url: str) -> list:
         
     Returns:
         list: List of available formats with resolution info
+        
+    Results are cached in memory and on disk for _FORMATS_CACHE_TTL seconds,
+    so asking again for the same video (even through another link shape or
+    with different tracking parameters) skips the extraction. A video already
+    probed by test_video_url() in this process is not extracted again either.
     """
+    cache_key = _cache_key(url)
+    entry = _load_formats_cache().get(cache_key)
+    if entry and time.time() - entry[0] < _FORMATS_CACHE_TTL:
+        return [dict(fmt) for fmt in entry[1]]
+    
+    probed = _probe_cache.get(cache_key)
+    if probed and probed.get('formats'):
+        video_formats = _filter_video_formats(probed['formats'])
+        if video_formats:
+            _store_formats(cache_key, video_formats)
+            return video_formats
+    
     try:
+        # Same options as the advanced test_video_url() attempt, so both share
+        # one pooled instance (and its cookies and open connections)
         ydl_opts = get_advanced_youtube_config()
-        ydl_opts['listformats'] = True
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            formats = info.get('formats', [])
+        with _pooled_ydl(ydl_opts) as ydl:
+            # The raw extractor result already lists every format; format
+            # selection and sorting are not needed just to show them
+            info = ydl.extract_info(url, download=False, process=False)
+            if info.get('_type') in ('url', 'url_transparent'):
+                # Redirect to another extractor: resolve it the regular way
+                info = ydl.process_ie_result(info, download=False)
+            video_formats = _filter_video_formats(info.get('formats') or [])
             
-            # Filter video formats and organize by resolution
-            video_formats = []
-            resolutions_seen = set()
-            
-            for fmt in formats:
-                if fmt.get('vcodec') != 'none' and fmt.get('height'):
-                    height = fmt.get('height')
-                    if height not in resolutions_seen:
-                        video_formats.append({
-                            'format_id': fmt.get('format_id'),
-                            'resolution': f"{fmt.get('width', 'N/A')}x{height}",
-                            'height': height,
-                            'ext': fmt.get('ext', 'mp4'),
-                            'filesize': fmt.get('filesize', 0)
-                        })
-                        resolutions_seen.add(height)
-            
-            # Sort by resolution (highest first)
-            video_formats.sort(key=lambda x: x['height'], reverse=True)
+            if video_formats:
+                _store_formats(cache_key, video_formats)
             
             return video_formats
             
     except Exception as e:
-        print(f"❌ Error getting formats: {e}")
+        logger.error("❌ Error getting formats: %s", e)
         return []
 
 def get_user_input_url() -> str:
@@ -764,18 +1565,23 @@ def get_user_input_url() -> str:
             print("   - https://example.com/stream.m3u8 (HLS)")
             print("   - https://example.com/manifest.mpd (DASH)")
 
-def get_user_format_choice(url: str) -> str:
+def get_user_format_choice(url: str, info: dict = None) -> str:
     """
     Prompts user to choose video format/resolution.
     
     Args:
         url (str): YouTube video URL
+        info (dict): Video info already extracted for this URL (e.g. by test_video_url());
+            when it lists formats, no extra extraction is made
         
     Returns:
         str: Selected format string for yt-dlp
     """
-    print("\n🔍 Getting available formats...")
-    formats = get_available_formats(url)
+    if info and info.get('formats'):
+        formats = _filter_video_formats(info['formats'])
+    else:
+        print("\n🔍 Getting available formats...")
+        formats = get_available_formats(url)
     
     if not formats:
         print("⚠️  Could not get formats. Using default quality (720p).")
@@ -784,16 +1590,23 @@ def get_user_format_choice(url: str) -> str:
     print("\n📹 Available formats:")
     print("0. Best quality available (recommended)")
     
-    for i, fmt in enumerate(formats[:8], 1):  # Limit to 8 options
+    max_choice = min(len(formats), 8)  # Limit to 8 options
+    visible = formats[:max_choice]
+    
+    for i, fmt in enumerate(visible, 1):
         size_info = ""
         if fmt['filesize'] > 0:
             size_mb = fmt['filesize'] / (1024 * 1024)
             size_info = f" (~{size_mb:.1f}MB)"
         print(f"{i}. {fmt['resolution']} ({fmt['ext']}){size_info}")
     
+    # The prompt and range error don't change between attempts
+    prompt = f"\n🎯 Choose format (0-{max_choice}): "
+    range_error = f"❌ Invalid choice! Enter a number between 0 and {max_choice}."
+    
     while True:
         try:
-            choice = input(f"\n🎯 Choose format (0-{min(len(formats), 8)}): ").strip()
+            choice = input(prompt).strip()
             
             if choice == '0':
                 # For HLS/segmented videos, use specific format strategy
@@ -812,8 +1625,8 @@ def get_user_format_choice(url: str) -> str:
                     return 'best'
             
             choice_num = int(choice)
-            if 1 <= choice_num <= min(len(formats), 8):
-                selected_format = formats[choice_num - 1]
+            if 1 <= choice_num <= max_choice:
+                selected_format = visible[choice_num - 1]
                 
                 # For HLS formats, use the specific format ID
                 format_id = selected_format.get('format_id', '')
@@ -825,7 +1638,7 @@ def get_user_format_choice(url: str) -> str:
                     print(f"✅ Selected: {selected_format['resolution']} ({selected_format['ext']})")
                     return format_string
             else:
-                print(f"❌ Invalid choice! Enter a number between 0 and {min(len(formats), 8)}.")
+                print(range_error)
                 
         except ValueError:
             print("❌ Enter a valid number!")
@@ -848,8 +1661,13 @@ def get_user_output_directory() -> str:
         # Expand user directory (~)
         choice = os.path.expanduser(choice)
         
-        if os.path.exists(choice):
-            if os.path.isdir(choice):
+        try:
+            st = os.stat(choice)
+        except OSError:
+            st = None
+        
+        if st is not None:
+            if stat.S_ISDIR(st.st_mode):
                 print(f"✅ Directory selected: {os.path.abspath(choice)}")
                 return choice
             else:
@@ -866,19 +1684,16 @@ def get_user_output_directory() -> str:
             else:
                 print("❌ Choose an existing directory or allow creation of a new one.")
 
-def test_video_url(url: str) -> tuple[bool, dict]:
+@lru_cache(maxsize=None)
+def _test_configs() -> tuple:
     """
-    Tests if a video URL is accessible and extractable by yt-dlp.
-    Uses multiple fallback methods for problematic videos including advanced bypass techniques.
-
-    Args:
-        url (str): Video URL to test
-
+    Builds the yt-dlp configurations tried by test_video_url(), once per process.
+    
     Returns:
-        tuple[bool, dict]: (Success status, video info dict)
+        tuple: Option dicts, from most advanced to the minimal fallback
     """
     # Multiple configurations to try in order - from most advanced to basic
-    test_configs = [
+    return (
         # Ultra-advanced configuration with browser cookie extraction
         {
             'quiet': True,
@@ -886,10 +1701,10 @@ def test_video_url(url: str) -> tuple[bool, dict]:
             'extract_flat': False,
             'cookiesfrombrowser': ('chrome',),  # Try Chrome cookies first
             'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36',
+                'User-Agent': _CHROME_USER_AGENT,
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
                 'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
+                'Accept-Encoding': _ACCEPT_ENCODING,
             },
             'extractor_args': {
                 'youtube': {
@@ -901,6 +1716,8 @@ def test_video_url(url: str) -> tuple[bool, dict]:
             },
             'retries': 15,
             'fragment_retries': 20,
+            'extractor_retries': 2,
+            'retry_sleep_functions': dict(_RETRY_SLEEP_FUNCTIONS),
             'geo_bypass': True,
             'age_limit': None,
         },
@@ -920,171 +1737,210 @@ def test_video_url(url: str) -> tuple[bool, dict]:
                 }
             },
             'retries': 10,
+            'extractor_retries': 2,
+            'retry_sleep_functions': dict(_RETRY_SLEEP_FUNCTIONS),
             'geo_bypass': True,
         },
 
         # Ultra-advanced configuration without cookies
         get_advanced_youtube_config(),
 
-        # Mobile Android client (often less restricted)
+        # Mobile, TV, embedded and web clients in one pass: yt-dlp tries each
+        # player client within a single extraction, instead of one full
+        # extractor run per client
         {
             'quiet': True,
             'no_warnings': True,
             'extract_flat': False,
             'http_headers': {
-                'User-Agent': 'com.google.android.youtube/17.31.35 (Linux; U; Android 11) gzip',
-                'X-YouTube-Client-Name': '3',
-                'X-YouTube-Client-Version': '17.31.35',
+                'User-Agent': _CHROME_USER_AGENT,
             },
             'extractor_args': {
                 'youtube': {
-                    'player_client': ['android'],
-                    'innertube_api_version': '1.20220908.01.00'
+                    'player_client': ['android', 'ios', 'tv_embedded', 'android_embedded', 'web'],
                 }
             },
+            'age_limit': None,  # Try to bypass age restrictions
             'retries': 10,
             'fragment_retries': 15,
+            'extractor_retries': 2,
+            'retry_sleep_functions': dict(_RETRY_SLEEP_FUNCTIONS),
             'geo_bypass': True,
         },
 
-        # iOS client bypass (Apple devices often less restricted)
+        # Minimal fallback
         {
             'quiet': True,
             'no_warnings': True,
-            'extract_flat': False,
-            'http_headers': {
-                'User-Agent': 'com.google.ios.youtube/17.33.2 (iPhone14,3; U; CPU iOS 15_6 like Mac OS X)',
-                'X-YouTube-Client-Name': '5',
-                'X-YouTube-Client-Version': '17.33.2',
-            },
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['ios'],
-                }
-            },
-            'retries': 10,
-            'geo_bypass': True,
-        },
+            'extract_flat': True,
+        }
+    )
 
-        # TV/Smart TV client (often bypasses many restrictions)
-        {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (SMART-TV; LINUX; Tizen 2.4.0) AppleWebKit/538.1 (KHTML, like Gecko) Version/2.4.0 TV Safari/538.1',
-            },
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['tv_embedded'],
-                }
-            },
-            'retries': 10,
-            'geo_bypass': True,
-        },
+def test_video_url(url: str) -> tuple[bool, dict]:
+    """
+    Tests if a video URL is accessible and extractable by yt-dlp.
+    Uses multiple fallback methods for problematic videos including advanced bypass techniques.
 
-        # Age-restricted bypass attempt
-        {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36',
-            },
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['android_embedded'],
-                    'skip': ['dash', 'hls']
-                }
-            },
-            'age_limit': None,  # Try to bypass age restrictions
-            'retries': 5,
-        },
+    Args:
+        url (str): Video URL to test
 
-        # Standard web configuration with enhanced settings
-        {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': False,
-            'http_headers': {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36',
-            },
-            'extractor_args': {
-                'youtube': {
-                    'player_client': ['web']
-                }
-            },
-            'retries': 5,
-        },
+    Returns:
+        tuple[bool, dict]: (Success status, video info dict)
+        
+    Successful results are remembered for the rest of the process and on disk
+    for _PROBE_CACHE_TTL seconds (per YouTube video ID, or per URL ignoring
+    tracking parameters), so probing the same video again, even from a new
+    run, is free.
+    """
+    cache_key = _cache_key(url)
+    info = _probe_cache.get(cache_key)
+    if info is None:
+        info = _load_probe(cache_key)
+        if info is None:
+            success, info = _probe_video_url(url)
+            if not success:
+                return False, info
+            _store_probe(cache_key, info)
+        _probe_cache[cache_key] = info
+    
+    # Callers may hand the info to yt-dlp, which fills it in place
+    return True, _copy_info(info)
 
-        # Minimal fallback
-        {
-            'quiet': True,
-            'no_warnings': True,
-            'extract_flat': True,
-        }
-    ]
+def _copy_info(value):
+    """
+    Copies the dicts and lists of a yt-dlp info dict, sharing everything else.
     
-    last_error = None
+    copy.deepcopy() would fail on (or duplicate) the generators and bound
+    methods yt-dlp sometimes stores inside, e.g. for live fragment lists.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_info(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_info(item) for item in value]
+    return value
+
+def _probe_video_url(url: str) -> tuple[bool, dict]:
+    """Uncached accessibility probe behind test_video_url()."""
+    test_configs = _test_configs()
+    
+    # The player-client variants only change what YouTube's extractor does;
+    # elsewhere they would repeat the advanced and minimal attempts
+    host = _hostname(url)
+    if not any(match.lastgroup == 'youtube' for match in _PLATFORM_HINT_RE.finditer(host)):
+        test_configs = tuple(
+            ydl_opts for ydl_opts in test_configs
+            if 'youtube' not in ydl_opts.get('extractor_args', {})
+        )
     
-    for ydl_opts in test_configs:
+    # Losing probes are stopped once a result is chosen, and all of them when
+    # whoever started this probe stops waiting for it
+    parent_stops = _stop_events()
+    stop = threading.Event()
+    
+    def probe(ydl_opts: dict) -> dict:
+        with _stoppable(parent_stops + (stop,)), _pooled_ydl(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+    
+    def probe_in_turn(queued: list) -> None:
+        for future, ydl_opts in queued:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(probe(ydl_opts))
+                except Exception as e:
+                    future.set_exception(e)
+    
+    # Full extraction of a playlist resolves every entry; one flat listing
+    # already shows the playlist is reachable
+    if _PLAYLIST_RE.search(url):
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return True, info
+            return True, probe(_PLAYLIST_PROBE_OPTS)
+        except Exception:
+            pass  # Fall back to the regular probes
+    
+    last_error = None
+    hard_failure = False
+    
+    # The configurations are independent network probes, so run them at once;
+    # the minimal one is only a last resort. Configs reading browser cookies
+    # share the cookie stores, so those run one after another on one worker
+    *probe_configs, fallback_config = test_configs
+    futures = []
+    queued = []
+    for ydl_opts in probe_configs:
+        futures.append(Future())
+        if 'cookiesfrombrowser' in ydl_opts:
+            queued.append((futures[-1], ydl_opts))
+    
+    executor = ThreadPoolExecutor(max_workers=_MAX_PARALLEL_PROBES)
+    try:
+        if queued:
+            executor.submit(probe_in_turn, queued)
+        for i, ydl_opts in enumerate(probe_configs):
+            if 'cookiesfrombrowser' not in ydl_opts:
+                futures[i] = executor.submit(probe, ydl_opts)
+        
+        # Results are taken in config order: a later config only wins once every
+        # earlier (richer) one has failed, so the outcome doesn't depend on timing
+        for future in futures:
+            try:
+                return True, future.result()
+            except Exception as e:
+                last_error = e
+                
+                # For some errors, don't try other configs
+                if _TERMINAL_ERROR_RE.search(str(e)):
+                    hard_failure = True
+                    break
                 
+                # Nobody is waiting for the answer any more
+                if any(event.is_set() for event in parent_stops):
+                    break
+    finally:
+        # Drop probes that haven't started, make the running ones give up at
+        # their next retry, and don't wait for them here
+        stop.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+    
+    if not hard_failure and not any(event.is_set() for event in parent_stops):
+        try:
+            return True, probe(fallback_config)
         except Exception as e:
             last_error = e
-            error_str = str(e).lower()
-            
-            # For some errors, don't try other configs
-            if any(term in error_str for term in ['private video', 'video removed', 'this video is unavailable']):
-                break
-                
-            # Continue to next config for other errors
-            continue
     
     # All configs failed, return detailed error info
     error_str = str(last_error)
     
     # Enhanced error handling with specific suggestions
-    if 'oauth token' in error_str.lower():
-        return False, {
-            'error': error_str,
-            'error_type': 'oauth_error',
-            'suggestion': 'Vimeo OAuth authentication failed. This video may require special permissions or be restricted.',
-            'help': 'Try using the webpage URL that embeds this video instead of the direct player URL.'
-        }
-    elif 'embed-only video' in error_str:
-        return False, {
-            'error': error_str,
-            'error_type': 'embed_only',
-            'suggestion': 'This video can only be played when embedded. Find the webpage that shows this video.',
-            'help': 'Look for articles or pages that display this video and use that URL instead.'
-        }
-    elif 'private video' in error_str.lower():
-        return False, {
-            'error': error_str,
-            'error_type': 'private',
-            'suggestion': 'This video is private and cannot be downloaded.',
-            'help': 'Only the video owner can access private videos.'
-        }
-    elif 'unavailable' in error_str.lower():
-        return False, {
-            'error': error_str,
-            'error_type': 'unavailable',
-            'suggestion': 'Video is unavailable. May be deleted, private, or geo-restricted.',
-            'help': 'Check if the video exists and is accessible from your location.'
-        }
-    else:
-        return False, {
-            'error': error_str,
-            'error_type': 'general',
-            'suggestion': 'Unknown error occurred. The video may have restrictions or be inaccessible.',
-            'help': 'Try a different video URL or check your internet connection.'
-        }
+    error_type, suggestion, help_text = _PROBE_ERROR_DETAILS[_classify_error(error_str, _PROBE_ERROR_DETAILS) or 'general']
+    return False, {
+        'error': error_str,
+        'error_type': error_type,
+        'suggestion': suggestion,
+        'help': help_text
+    }
 
-def download_video(url: str, output_path: str = '.', format_selector: str = 'best[height<=720]') -> bool:
+def test_videos_batch(urls: list) -> dict:
+    """
+    Tests several video URLs at once, sharing pooled yt-dlp instances between them.
+    
+    Args:
+        urls (list): Video URLs to test
+        
+    Returns:
+        dict: URL -> (Success status, video info dict), as returned by test_video_url()
+    """
+    if not urls:
+        return {}
+    
+    unique_urls = list(dict.fromkeys(urls))
+    with ThreadPoolExecutor(max_workers=min(_MAX_PARALLEL_PROBES, len(unique_urls))) as executor:
+        return dict(zip(unique_urls, executor.map(test_video_url, unique_urls)))
+
+def download_video(url: str, output_path: str = '.', format_selector: str = 'best[height<=720]',
+                   concurrent_fragments: int = _DEFAULT_CONCURRENT_FRAGMENTS, info: dict = None,
+                   interactive: bool = True) -> bool:
     """
     Downloads a video from supported platforms (YouTube, Vimeo) using yt-dlp.
     Supports segmented/chunked videos and streaming formats (DASH, HLS).
@@ -1093,6 +1949,12 @@ def download_video(url: str, output_path: str = '.', format_selector: str = 'bes
         url (str): Video URL (YouTube, Vimeo, etc.)
         output_path (str): Directory to save the video (default: current directory)
         format_selector (str): Format selection string for yt-dlp
+        concurrent_fragments (int): Number of HLS/DASH fragments fetched in parallel
+            (clamped to 1-16, default: _DEFAULT_CONCURRENT_FRAGMENTS, 4-8 by CPU count)
+        info (dict): Video info already extracted for this URL (e.g. by test_video_url());
+            when given, the metadata extraction round-trip is skipped
+        interactive (bool): Whether the user may be asked questions, e.g. to search
+            for the full video when a chunk download fails (default: True)
         
     Returns:
         bool: True if download was successful, False otherwise
@@ -1107,18 +1969,20 @@ def download_video(url: str, output_path: str = '.', format_selector: str = 'bes
         >>> download_video('https://example.com/video', '/tmp')
         False
     """
+    import yt_dlp
+    
     # Check if this is a Vimeo CDN chunk URL
     chunk_info = detect_vimeo_chunk(url)
     if chunk_info.get('is_chunk'):
-        print(f"🔗 Detected Vimeo CDN chunk!")
-        print(f"📦 Chunk size: {chunk_info.get('chunk_size', 'unknown')} bytes")
-        print(f"📋 Range: {chunk_info.get('range_start', '?')}-{chunk_info.get('range_end', '?')}")
+        logger.info("🔗 Detected Vimeo CDN chunk!")
+        logger.info("📦 Chunk size: %s bytes", chunk_info.get('chunk_size', 'unknown'))
+        logger.info("📋 Range: %s-%s", chunk_info.get('range_start', '?'), chunk_info.get('range_end', '?'))
         
         # Use direct download approach for chunks
         chunk_success = download_vimeo_chunk_direct(url, output_path, chunk_info)
         
         # If chunk download failed, offer to try finding the full video
-        if not chunk_success:
+        if not chunk_success and interactive:
             print(f"\n💡 Chunk download failed. Would you like to try finding the full video?")
             try_full = input("🔍 Search for full video from chunk? (y/N): ").strip().lower()
             if try_full in ['y', 'yes']:
@@ -1126,23 +1990,29 @@ def download_video(url: str, output_path: str = '.', format_selector: str = 'bes
         
         return chunk_success
     
+    # Resolve the directory once so yt-dlp gets an absolute output template
+    output_dir = Path(output_path).absolute()
+    
     # Build download config based on the advanced base config (includes js_runtimes, remote_components, cookies)
     ydl_opts = get_advanced_youtube_config()
     ydl_opts.update({
         'format': format_selector,
-        'outtmpl': os.path.join(output_path, '%(title).200s.%(ext)s'),
+        'outtmpl': os.path.join(os.fspath(output_dir), _OUTTMPL_FMT),
         'quiet': False,
         'no_warnings': False,
 
-        # Fragment/segment handling
+        # Fragment/segment handling: a fragment still missing after its retries
+        # is skipped instead of discarding everything downloaded so far, and an
+        # interrupted download resumes from its .part file
         'fragment_retries': 15,
-        'skip_unavailable_fragments': False,
+        'skip_unavailable_fragments': True,
         'keep_fragments': False,
-        'abort_on_unavailable_fragment': True,
+        'continuedl': True,
 
         # Network options
         'http_chunk_size': 10485760,    # 10MB chunks
-        'concurrent_fragment_downloads': 1,
+        'buffersize': 1048576,          # 1MB initial read block (yt-dlp starts at 1KB)
+        'concurrent_fragment_downloads': max(1, min(int(concurrent_fragments), _MAX_CONCURRENT_FRAGMENTS)),
 
         # HLS/DASH
         'hls_prefer_native': True,
@@ -1155,152 +2025,295 @@ def download_video(url: str, output_path: str = '.', format_selector: str = 'bes
         'ignoreerrors': False,
     })
     
+    # Split single-file downloads into parallel Range requests when aria2c is installed.
+    # Vimeo is left to the native downloader: its signed CDN URLs rely on the
+    # cookies and headers of the extracting session, which aria2c doesn't share
+    if _which('aria2c') and detect_platform(url) != 'vimeo':
+        ydl_opts['external_downloader'] = {'http': 'aria2c'}
+        ydl_opts['external_downloader_args'] = {'aria2c': list(_ARIA2C_ARGS)}
+    
     # Validate if output directory exists
-    if not os.path.exists(output_path):
-        try:
-            os.makedirs(output_path, exist_ok=True)
-            print(f"📁 Directory created: {output_path}")
-        except OSError as e:
-            print(f"❌ Error creating directory {output_path}: {e}")
-            return False
+    try:
+        output_dir.mkdir(parents=True)
+        logger.info("📁 Directory created: %s", output_path)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.error("❌ Error creating directory %s: %s", output_path, e)
+        return False
     
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            print(f"🔍 Extracting video information...")
-            
-            # Get video information without downloading
-            info = ydl.extract_info(url, download=False)
+        with _pooled_ydl(ydl_opts) as ydl:
+            prefetched = info is not None
+            if prefetched:
+                logger.info("♻️  Reusing extracted video information...")
+            else:
+                logger.info("🔍 Extracting video information...")
+                
+                # Get video information without downloading; the raw extractor
+                # result already has the metadata shown below, and format
+                # selection happens once, in process_ie_result()
+                info = ydl.extract_info(url, download=False, process=False)
             
             # Display video metadata
             title = info.get('title', 'N/A')
-            duration = info.get('duration', 0)
-            view_count = info.get('view_count', 0)
+            duration = info.get('duration') or 0
+            view_count = info.get('view_count') or 0
             uploader = info.get('uploader', 'N/A')
             upload_date = info.get('upload_date', 'N/A')
             
-            print(f"📺 Title: {title}")
-            print(f"⏱️  Duration: {duration // 60}:{duration % 60:02d} ({duration}s)")
-            print(f"👁️  Views: {view_count:,}")
-            print(f"📺 Channel: {uploader}")
-            print(f"📅 Upload date: {upload_date}")
+            logger.info("📺 Title: %s", title)
+            logger.info("⏱️  Duration: %s:%02d (%ss)", duration // 60, duration % 60, duration)
+            logger.info("👁️  Views: %s", format(view_count, ','))
+            logger.info("📺 Channel: %s", uploader)
+            logger.info("📅 Upload date: %s", upload_date)
             
             # Confirm before download
-            print(f"\n⬇️  Starting download...")
+            logger.info("\n⬇️  Starting download...")
             
-            # Perform the download
-            ydl.download([url])
+            # Perform the download from the extracted info, without fetching it again
+            try:
+                ydl.process_ie_result(info, download=True)
+            except yt_dlp.DownloadError:
+                if not prefetched:
+                    raise
+                # Stream URLs in the prefetched info may be signed for another session
+                logger.warning("⚠️  Prefetched information could not be used, extracting again...")
+                ydl.download([url])
             
-            print(f"✅ Download completed successfully!")
-            print(f"📂 File saved to: {output_path}")
+            logger.info("✅ Download completed successfully!")
+            logger.info("📂 File saved to: %s", output_path)
             return True
             
     except yt_dlp.DownloadError as e:
-        print(f"❌ yt-dlp specific error: {str(e)}")
+        logger.error("❌ yt-dlp specific error: %s", e)
         return False
     except Exception as e:
-        print(f"❌ Unexpected error downloading video: {str(e)}")
+        logger.error("❌ Unexpected error downloading video: %s", e)
         return False
 
-def main() -> None:
+def _download_site(url: str) -> str:
+    """
+    Returns the site download_videos() counts a URL against.
+    
+    YouTube and Vimeo URLs give their platform name whatever the host
+    (youtu.be, m.youtube.com, player.vimeo.com, ...), even in shapes the
+    validators don't accept; other URLs give their host without userinfo,
+    port and a leading 'www.' or 'm.'.
+    """
+    platform = detect_platform(url)
+    if platform in ('youtube', 'vimeo'):
+        return platform
+    host = _hostname(url).rpartition('@')[2].partition(':')[0]
+    for platform, domains in _PLATFORM_DOMAINS.items():
+        if any(host == domain or host.endswith('.' + domain) for domain in domains):
+            return platform
+    for prefix in ('www.', 'm.'):
+        if host.startswith(prefix):
+            return host[len(prefix):]
+    return host
+
+def download_videos(urls: list[str], output_path: str = '.', format_selector: str = 'best[height<=720]',
+                    workers: int = 4) -> list[bool]:
+    """
+    Downloads several videos at once, each with download_video() on its own thread.
+    
+    The work is network-bound (yt-dlp releases the GIL while waiting on
+    sockets), so threads are enough; downloads never prompt the user.
+    
+    Args:
+        urls (list[str]): Video URLs to download
+        output_path (str): Directory to save the videos (default: current directory)
+        format_selector (str): yt-dlp format selector used for every video
+        workers (int): Maximum simultaneous downloads; at most _MAX_DOWNLOADS_PER_HOST
+            of them go to the same site (YouTube and Vimeo each count as one
+            site whatever their hostname; other URLs are grouped by host)
+        
+    Returns:
+        list[bool]: download_video() result for each URL, in order
+    """
+    results = [False] * len(urls)
+    if not urls:
+        return results
+    
+    # Queue the downloads per site so one never gets more than its share
+    queues = {}
+    for index, url in enumerate(urls):
+        queues.setdefault(_download_site(url), []).append(index)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(urls)))) as executor:
+        running = {}
+        
+        def submit_next(site: str) -> None:
+            if queues[site]:
+                index = queues[site].pop(0)
+                future = executor.submit(download_video, urls[index], output_path, format_selector,
+                                         interactive=False)
+                running[future] = (index, site)
+        
+        for site in queues:
+            for _ in range(_MAX_DOWNLOADS_PER_HOST):
+                submit_next(site)
+        
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, site = running.pop(future)
+                try:
+                    results[index] = future.result()
+                except Exception:
+                    logger.exception("❌ Download of %s failed", urls[index])
+                submit_next(site)
+    
+    return results
+
+def main(argv: list = None) -> None:
     """
     Main function to execute the video downloader with interactive terminal interface.
     
     Prompts user for:
     - Video URL (YouTube/Vimeo with validation)
+    - Output directory (while the URL is tested in the background)
     - Video format/resolution
-    - Output directory
     
-    Then downloads the video with the selected options.
+    Then downloads the video with the selected options. Each value given on the
+    command line (--url, --format, --output, --yes) skips its prompt, so the
+    downloader can also run unattended from scripts.
+    
+    Args:
+        argv (list): Command-line arguments (default: sys.argv[1:])
     """
-    print("🎬 Universal Video Downloader")
-    print("=" * 60)
-    print("📱 Interactive Video Downloader")
-    print("🎯 Supports: YouTube, Vimeo, HLS/DASH streams, Direct videos")
-    print("🔗 Handles segmented/chunked videos automatically")
-    print("=" * 60)
+    parser = argparse.ArgumentParser(description="Universal Video Downloader (YouTube, Vimeo, HLS/DASH, direct videos)")
+    parser.add_argument('--url', help="video URL (prompted when omitted)")
+    parser.add_argument('--format', dest='format_selector', metavar='FORMAT',
+                        help="yt-dlp format selector, e.g. 'best[height<=720]' (prompted when omitted)")
+    parser.add_argument('--output', help="output directory (prompted when omitted)")
+    parser.add_argument('-y', '--yes', action='store_true', help="start the download without asking for confirmation")
+    args = parser.parse_args(argv)
+    
+    if args.url and detect_platform(args.url) == 'unknown':
+        parser.error(f"invalid video URL: {args.url}")
+    
+    # Without a terminal on stdin every prompt would just hit EOF: require
+    # the flags that replace them up front instead
+    interactive = sys.stdin.isatty()
+    if not interactive:
+        missing = [flag for flag, value in (('--url', args.url), ('--format', args.format_selector),
+                                            ('--output', args.output), ('--yes', args.yes)) if not value]
+        if missing:
+            parser.error(f"stdin is not a terminal, so these prompts can't be answered; pass {', '.join(missing)}")
+    
+    logger.info("🎬 Universal Video Downloader")
+    logger.info("=" * 60)
+    logger.info("📱 Interactive Video Downloader")
+    logger.info("🎯 Supports: YouTube, Vimeo, HLS/DASH streams, Direct videos")
+    logger.info("🔗 Handles segmented/chunked videos automatically")
+    logger.info("=" * 60)
 
     _check_and_update_ytdlp()
 
+    probe = None
     try:
         # Step 1: Get and validate video URL
-        print("\n🔸 STEP 1: Video URL")
-        video_url = get_user_input_url()
+        logger.info("\n🔸 STEP 1: Video URL")
+        video_url = args.url.strip() if args.url else get_user_input_url()
+        
+        # Step 1.5 starts right away in the background: the accessibility test
+        # is seconds of network time that the directory prompt can hide
+        probe_stop = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        probe = executor.submit(_call_stoppable, (probe_stop,), test_video_url, video_url)
+        executor.shutdown(wait=False)
+        
+        # Step 2: Select output directory
+        logger.info("\n🔸 STEP 2: Output directory")
+        # Resolved once: reused by the summary, the download and the final message
+        output_directory = os.path.abspath(args.output or get_user_output_directory())
         
         # Step 1.5: Test video URL accessibility
-        print("\n🔍 Testing video URL accessibility...")
-        success, info = test_video_url(video_url)
+        logger.info("\n🔍 Testing video URL accessibility...")
+        success, info = probe.result()
         if not success:
             error_type = info.get('error_type', 'general')
-            print(f"❌ Cannot access video: {info.get('error', 'Unknown error')}")
+            logger.error("❌ Cannot access video: %s", info.get('error', 'Unknown error'))
             
             # Show specific suggestions based on error type
             if 'suggestion' in info:
-                print(f"💡 Suggestion: {info['suggestion']}")
+                logger.warning("💡 Suggestion: %s", info['suggestion'])
             if 'help' in info:
-                print(f"🆘 Help: {info['help']}")
+                logger.warning("🆘 Help: %s", info['help'])
                 
             # Special handling for OAuth errors
             if error_type == 'oauth_error':
-                print("\n🔧 Troubleshooting OAuth errors:")
-                print("   1. Try using a different Vimeo URL format")
-                print("   2. Look for the webpage that embeds this video")
-                print("   3. Some Vimeo videos require special permissions")
-                print("   4. The video may be restricted or private")
+                logger.warning("\n🔧 Troubleshooting OAuth errors:")
+                logger.warning("   1. Try using a different Vimeo URL format")
+                logger.warning("   2. Look for the webpage that embeds this video")
+                logger.warning("   3. Some Vimeo videos require special permissions")
+                logger.warning("   4. The video may be restricted or private")
             
             return
         else:
-            print("✅ Video URL is accessible!")
+            logger.info("✅ Video URL is accessible!")
             if 'title' in info:
-                print(f"📺 Title: {info['title']}")
+                logger.info("📺 Title: %s", info['title'])
             
             # Show if video is segmented/chunked
             formats = info.get('formats', [])
-            segmented_formats = [f for f in formats if f.get('fragments')]
+            segmented_formats = [f for f in formats if f.get('fragments')
+                                 or str(f.get('protocol', '')).startswith(_SEGMENTED_PROTOCOLS)]
             if segmented_formats:
-                print(f"🔗 Detected {len(segmented_formats)} segmented/chunked formats")
-                print("ℹ️  This video uses chunks - optimized download settings will be applied")
-        
-        # Step 2: Select video format/resolution
-        print("\n🔸 STEP 2: Video format")
-        format_selector = get_user_format_choice(video_url)
+                logger.info("🔗 Detected %s segmented/chunked formats", len(segmented_formats))
+                logger.info("ℹ️  This video uses chunks - optimized download settings will be applied")
         
-        # Step 3: Select output directory
-        print("\n🔸 STEP 3: Output directory")
-        output_directory = get_user_output_directory()
+        # Step 3: Select video format/resolution
+        logger.info("\n🔸 STEP 3: Video format")
+        format_selector = args.format_selector or get_user_format_choice(video_url, info)
         
         # Show summary before download
-        print("\n" + "=" * 50)
-        print("📋 DOWNLOAD SUMMARY:")
-        print(f"🔗 URL: {video_url}")
-        print(f"🎯 Format: {format_selector}")
-        print(f"📁 Destination: {os.path.abspath(output_directory)}")
-        print("=" * 50)
+        logger.info("\n" + "=" * 50)
+        logger.info("📋 DOWNLOAD SUMMARY:")
+        logger.info("🔗 URL: %s", video_url)
+        logger.info("🎯 Format: %s", format_selector)
+        logger.info("📁 Destination: %s", output_directory)
+        logger.info("=" * 50)
         
         # Confirm before starting download
-        confirm = input("\n▶️  Start download? (Y/n): ").strip().lower()
-        if confirm in ['n', 'no']:
-            print("❌ Download cancelled by user.")
-            return
+        if not args.yes:
+            confirm = input("\n▶️  Start download? (Y/n): ").strip().lower()
+            if confirm in ['n', 'no']:
+                logger.info("❌ Download cancelled by user.")
+                return
         
         # Execute the download
-        print("\n🚀 Starting download...")
-        success = download_video(video_url, output_directory, format_selector)
+        logger.info("\n🚀 Starting download...")
+        # Fragments are always fetched in parallel (_DEFAULT_CONCURRENT_FRAGMENTS);
+        # progressive downloads simply ignore the setting
+        success = download_video(video_url, output_directory, format_selector,
+                                 info=info,  # Already extracted in step 1.5
+                                 interactive=interactive)
         
         if success:
-            print("\n🎉 Download completed successfully!")
-            print(f"📂 File saved to: {os.path.abspath(output_directory)}")
+            logger.info("\n🎉 Download completed successfully!")
+            logger.info("📂 File saved to: %s", output_directory)
         else:
-            print("\n💥 Download failed. Check the URL and try again.")
+            logger.error("\n💥 Download failed. Check the URL and try again.")
             exit(1)
             
     except KeyboardInterrupt:
-        print("\n\n⏹️  Download interrupted by user.")
-        print("👋 Goodbye!")
+        logger.info("\n\n⏹️  Download interrupted by user.")
+        logger.info("👋 Goodbye!")
         exit(0)
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        print("💡 Try again or check your internet connection.")
+        logger.error("\n❌ Unexpected error: %s", e)
+        logger.warning("💡 Try again or check your internet connection.")
         exit(1)
+    finally:
+        # On Ctrl-C (or any early exit) a background probe still running would
+        # keep the interpreter alive until it finished: make it give up instead
+        if probe is not None and not probe.done():
+            probe_stop.set()
+            probe.cancel()
+            executor.shutdown(wait=False)
 
 
 if __name__ == "__main__":
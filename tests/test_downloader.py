@@ -10,7 +10,9 @@ import os
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from universal_video_downloader import validate_youtube_url
+import universal_video_downloader
+from universal_video_downloader import validate_youtube_url, detect_platform, _filter_video_formats, _cache_key, _download_site
+from universal_video_downloader import test_video_url as probe_video_url  # aliased so pytest doesn't collect it
 
 class TestYouTubeDownloader:
     """Test class for YouTube downloader functions"""
@@ -49,11 +51,116 @@ class TestYouTubeDownloader:
             ("https://youtube.com/watch?", False),
             ("youtube.com/watch?v=dQw4w9WgXcQ123", False),  # Too long
             ("youtube.com/watch?v=dQw4w9WgXc", False),      # Too short
+            ("https://youtu.be/dQw4w9WgXcQ/", True),        # Trailing slash
+            ("  https://youtu.be/dQw4w9WgXcQ \n", True),     # Surrounding whitespace
         ]
         
         for url, expected in edge_cases:
             result = validate_youtube_url(url)
             assert result == expected, f"URL: {url}, Expected: {expected}, Got: {result}"
+    
+    def test_adversarial_urls_are_rejected(self):
+        """Test that long runs of separators around a missing or broken ID are rejected"""
+        adversarial_urls = [
+            "https://www.youtube.com/watch?" + "?&" * 250,
+            "https://www.youtube.com/watch?" + "&v=" * 200 + "!",
+            "youtube.com/watch?" + "a&" * 250 + "v=short",
+        ]
+        
+        for url in adversarial_urls:
+            assert validate_youtube_url(url) == False, f"Should be invalid: {url[:40]}..."
+    
+    def test_repeated_probe_is_served_from_cache(self, monkeypatch, tmp_path):
+        """Test that probing the same video twice only extracts it once"""
+        import yt_dlp
+        extractions = []
+        
+        class FakeYoutubeDL:
+            def __init__(self, params):
+                self.params = params
+            
+            def extract_info(self, url, download=False):
+                extractions.append(url)
+                return {'id': 'dQw4w9WgXcQ', 'title': 'Cached video', 'formats': []}
+        
+        monkeypatch.setattr(yt_dlp, 'YoutubeDL', FakeYoutubeDL)
+        monkeypatch.setattr(universal_video_downloader, '_YDL_POOL', {})
+        monkeypatch.setattr(universal_video_downloader, '_probe_cache', {})
+        monkeypatch.setattr(universal_video_downloader, '_PROBE_CACHE_DIR', tmp_path)
+        
+        success, info = probe_video_url("https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+        assert success and info['title'] == 'Cached video'
+        first_run = len(extractions)
+        
+        success, info = probe_video_url("https://youtu.be/dQw4w9WgXcQ?t=42")
+        assert success and info['title'] == 'Cached video'
+        assert len(extractions) == first_run, "Second probe should not extract again"
+
+    def test_format_list_order(self):
+        """Test that format menus list one format per height, highest first, whatever the input order"""
+        ascending = [{'format_id': str(h), 'height': h, 'vcodec': 'avc1'} for h in (360, 480, 480, 720, 1080)]
+        shuffled = [ascending[i] for i in (3, 0, 4, 1, 2)]
+        
+        for formats in (ascending, shuffled):
+            heights = [fmt['height'] for fmt in _filter_video_formats(formats)]
+            assert heights == [1080, 720, 480, 360], f"Unexpected order: {heights}"
+    
+    def test_best_format_per_height(self):
+        """Test that the highest-bitrate format of each height is kept, whatever its position"""
+        formats = [
+            {'format_id': '720-hi', 'height': 720, 'vcodec': 'avc1', 'tbr': 2500},
+            {'format_id': '720-lo', 'height': 720, 'vcodec': 'avc1', 'tbr': 900},
+            {'format_id': '360-lo', 'height': 360, 'vcodec': 'avc1', 'tbr': 300},
+            {'format_id': '360-hi', 'height': 360, 'vcodec': 'avc1', 'tbr': 700},
+        ]
+        
+        chosen = [fmt['format_id'] for fmt in _filter_video_formats(formats)]
+        assert chosen == ['720-hi', '360-hi'], f"Unexpected formats: {chosen}"
+
+    def test_playlist_urls_have_their_own_cache_key(self):
+        """Test that a video and the same video inside a playlist don't share cached results"""
+        video_key = _cache_key("https://youtu.be/dQw4w9WgXcQ")
+        playlist_key = _cache_key("https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1234567890")
+        
+        assert video_key == _cache_key("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=42")
+        assert video_key == _cache_key(" https://youtu.be/dQw4w9WgXcQ/ ")
+        assert video_key == "youtube:dQw4w9WgXcQ", f"Unexpected key: {video_key}"
+        assert playlist_key != video_key, f"Both URLs map to {video_key}"
+
+class TestDetectPlatform:
+    """Test class for platform detection"""
+    
+    def test_known_platforms(self):
+        """Test detection of each supported platform"""
+        cases = [
+            ("https://www.youtube.com/watch?v=dQw4w9WgXcQ", 'youtube'),
+            ("https://youtu.be/dQw4w9WgXcQ", 'youtube'),
+            ("https://vimeo.com/123456789", 'vimeo'),
+            ("https://player.vimeo.com/video/123456789", 'vimeo'),
+            ("https://videoaddress.com.br/video.m3u8", 'generic'),
+            ("https://example.com/manifest.mpd", 'generic'),
+            ("https://example.com", 'unknown'),
+        ]
+        
+        for url, expected in cases:
+            result = detect_platform(url)
+            assert result == expected, f"URL: {url}, Expected: {expected}, Got: {result}"
+    
+    def test_platform_name_outside_host(self):
+        """Test that a platform name in the path or query does not decide the platform"""
+        assert detect_platform("https://example.com/?next=youtube.com") == 'unknown'
+        assert detect_platform("https://example.com/vimeo.com/123/video.mp4") == 'generic'
+    
+    def test_download_site_groups_platform_hosts(self):
+        """Test that download_videos() counts every YouTube/Vimeo host as one site"""
+        youtube = ["https://www.youtube.com/watch?v=dQw4w9WgXcQ", "https://youtu.be/dQw4w9WgXcQ",
+                   "https://m.youtube.com/watch?v=dQw4w9WgXcQ", "https://youtube.com/shorts/dQw4w9WgXcQ"]
+        vimeo = ["https://vimeo.com/123456789", "https://player.vimeo.com/video/123456789"]
+        
+        assert {_download_site(url) for url in youtube} == {'youtube'}
+        assert {_download_site(url) for url in vimeo} == {'vimeo'}
+        assert _download_site("https://www.example.com/a.m3u8") == _download_site("https://example.com/b.m3u8")
+        assert _download_site("https://notyoutube.com/watch?v=dQw4w9WgXcQ") == 'notyoutube.com'
 
 def test_url_validation():
     """Test URL validation function (legacy function for backward compatibility)"""
@@ -9,7 +9,9 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.universal_video_downloader import (
-    test_video_url, 
+    # Aliased: pytest would collect the test_* names as tests
+    test_video_url as probe_video_url,
+    test_videos_batch as probe_videos_batch,
     download_video, 
     detect_platform, 
     try_alternative_extraction_methods
@@ -45,6 +47,10 @@ def test_problematic_urls():
         }
     ]
     
+    # Probe every URL concurrently up front; results are still reported in order
+    print("⚡ Testing accessibility of all URLs...")
+    results = probe_videos_batch([test_case['url'] for test_case in test_cases])
+    
     for i, test_case in enumerate(test_cases, 1):
         print(f"\n🔍 Test {i}: {test_case['description']}")
         print(f"📋 URL: {test_case['url']}")
@@ -53,9 +59,7 @@ def test_problematic_urls():
         platform = detect_platform(test_case['url'])
         print(f"🎯 Platform: {platform}")
         
-        # Test URL accessibility
-        print("⚡ Testing accessibility...")
-        success, info = test_video_url(test_case['url'])
+        success, info = results[test_case['url']]
         
         if success:
             print("✅ Video accessible!")
@@ -97,7 +101,7 @@ def demonstrate_chunked_video_handling():
    • Multiple fallback configurations
    • Enhanced HTTP headers to avoid blocks
    • Increased retry counts for fragments (15 retries)
-   • Sequential fragment downloads for stability
+   • Parallel fragment downloads (4-8 at once, tunable)
    • Longer timeout for slow connections (60s)
    • Native HLS downloader preference
    
@@ -143,7 +147,7 @@ def interactive_troubleshooting():
         
         # Step 2: Test accessibility
         print("⚡ Testing accessibility...")
-        success, info = test_video_url(url)
+        success, info = probe_video_url(url)
         
         if success:
             print("✅ Video is accessible!")
@@ -4,10 +4,16 @@ Test script for segmented video downloads.
 This script demonstrates how to download videos that come in segments/chunks.
 """
 
-from src.universal_video_downloader import download_video, test_video_url, detect_platform
+from src.universal_video_downloader import download_video, detect_platform
+# Aliased: pytest would collect the test_* names as tests
+from src.universal_video_downloader import test_video_url as probe_video_url
+from src.universal_video_downloader import test_videos_batch as probe_videos_batch
 
-def test_url(url: str):
-    """Test a URL and show its platform detection and accessibility."""
+def _check_url(url: str, result: tuple = None):
+    """Test a URL and show its platform detection and accessibility.
+    
+    result is an already probed (success, info) pair, e.g. from probe_videos_batch().
+    """
     print(f"\n🔍 Testing URL: {url}")
     print("-" * 60)
     
@@ -17,7 +23,7 @@ def test_url(url: str):
     
     # Test accessibility
     print("🔍 Testing accessibility...")
-    success, info = test_video_url(url)
+    success, info = result if result is not None else probe_video_url(url)
     
     if success:
         print("✅ URL is accessible!")
@@ -53,8 +59,10 @@ def main():
         # "https://example.com/video.m3u8",
     ]
     
+    # Probe the URLs concurrently, then report them one by one
+    results = probe_videos_batch(test_urls)
     for url in test_urls:
-        test_url(url)
+        _check_url(url, results[url])
     
     # Interactive testing
     print("\n" + "=" * 60)
@@ -65,7 +73,7 @@ def main():
         url = input("\n🔗 Enter URL: ").strip()
         if not url:
             break
-        test_url(url)
+        _check_url(url)
         
         # Ask if user wants to try downloading
         download = input("\n💾 Try downloading this video? (y/N): ").strip().lower()